@@ -144,6 +144,7 @@ async def invite_user(
     # 이메일 발송 성공 시 상태를 invited로 갱신
     stored_user["status"] = "invited"
     await role_svc.storage.save_portal_user(stored_user)
+    role_svc.invalidate_user(normalized)
 
     return {"message": f"Invitation email sent to {normalized}"}
 
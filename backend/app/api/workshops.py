@@ -6,7 +6,7 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, Query, UploadFile
 from fastapi.responses import Response
 from pydantic import BaseModel
 
@@ -135,10 +135,13 @@ async def _get_workshop_or_raise(storage, workshop_id: str) -> dict:
 
 @router.get("", response_model=list[WorkshopResponse])
 async def list_workshops(
+    limit: Optional[int] = Query(
+        None, ge=1, description="최신순 상위 N개만 반환 (미지정 시 전체)"
+    ),
     workshop_service=Depends(get_workshop_service),
 ):
     """전체 워크샵 목록을 조회한다 (비용 제외, 빠른 응답)."""
-    return await workshop_service.list_workshops()
+    return await workshop_service.list_workshops(limit=limit)
 
 
 @router.get("/costs")
@@ -32,8 +32,18 @@ class Settings(BaseSettings):
     session_secret_key: str = "change-this-secret-key-in-production"
 
     table_storage_account: str = "workshopstorage"
+    # 첫 사용 시 필요한 테이블을 생성한다. 모든 테이블을 IaC로 프로비저닝한
+    # 환경에서는 false로 두어 시작 시 생성 확인 요청을 생략할 수 있다
+    ensure_storage_tables: bool = True
+    # 목록 조회 인프로세스 캐시 TTL (저장/삭제 시 즉시 무효화)
+    workshop_list_cache_ttl_seconds: int = 30
+    # 템플릿 목록과 배포용 템플릿 본문에 공통 적용
+    template_list_cache_ttl_seconds: int = 300
 
     use_azure_cli_credential: bool = False
+    # 설정 시 DefaultAzureCredential 체인 탐색 없이 해당 User-assigned
+    # Managed Identity로 바로 인증한다 (프로덕션용)
+    managed_identity_client_id: str = ""
 
     @field_validator("use_azure_cli_credential", mode="before")
     @classmethod
@@ -215,6 +225,18 @@ class Settings(BaseSettings):
     # Azure SDK retry
     azure_retry_total: int = 3
     azure_retry_backoff_factor: float = 1.0
+    # 재시도 간 최대 대기(초). 지수 백오프의 상한이며, ARM 클라이언트는
+    # JitteredAsyncRetryPolicy로 서버 Retry-After도 이 값으로 제한한다
+    # (Table Storage 클라이언트는 자체 재시도 정책을 써서 Retry-After를 그대로 따른다)
+    azure_retry_backoff_max: int = 30
+    # 장기 실행 작업(ARM 배포) 상태 폴링 간격(초). 서버 Retry-After가 있으면 그 값을 따른다
+    azure_lro_poll_interval: int = 5
+    # Azure SDK 비동기 클라이언트의 호스트당 커넥션 풀 크기.
+    # 단일 스토리지 계정/ARM 엔드포인트로 몰리는 동시 요청 수에 맞춘다
+    azure_http_pool_size_per_host: int = 64
+
+    # 벌크 작업 전체(모든 구독 합산) ARM 동시 요청 상한 (429 throttling 방지)
+    azure_bulk_concurrency: int = 16
 
     model_config = {"env_file": ".env", "case_sensitive": False, "extra": "ignore"}
 
@@ -1,6 +1,8 @@
 """FastAPI 의존성 주입 팩토리.
 
 각 서비스 싱글턴 인스턴스를 FastAPI의 ``Depends()``를 통해 제공한다.
+동기 함수 의존성은 요청마다 스레드풀에서 실행되므로, I/O가 없는 의존성은
+``async def``로 선언하여 이벤트 루프에서 바로 실행되게 한다.
 """
 from typing import Any, Optional
 
@@ -10,7 +12,7 @@ from app.exceptions import AuthorizationError
 from app.services.cost import cost_service
 from app.services.email import email_service
 from app.services.entra_id import entra_id_service
-from app.services.policy import policy_service
+from app.services.policy import get_policy_service as _get_policy_service
 from app.services.resource_manager import resource_manager_service
 from app.services.role import role_service
 from app.services.subscription import subscription_service
@@ -18,47 +20,50 @@ from app.services.storage import storage_service
 from app.services.workshop import workshop_service
 
 
-def get_storage_service():
+async def get_storage_service():
     """StorageService 싱글턴을 반환한다."""
     return storage_service
 
 
-def get_entra_id_service():
+async def get_entra_id_service():
     """EntraIDService 싱글턴을 반환한다."""
     return entra_id_service
 
 
-def get_resource_manager_service():
-    """ResourceManagerService 싱글턴을 반환한다."""
-    return resource_manager_service
+async def get_policy_service():
+    """PolicyService 싱글턴을 반환한다.
+
+    이벤트 루프에서 실행되므로 싱글턴이 스레드 간에 중복 생성되지 않는다.
+    """
+    return _get_policy_service()
 
 
-def get_policy_service():
-    """PolicyService 싱글턴을 반환한다."""
-    return policy_service
+async def get_resource_manager_service():
+    """ResourceManagerService 싱글턴을 반환한다."""
+    return resource_manager_service
 
 
-def get_cost_service():
+async def get_cost_service():
     """CostService 싱글턴을 반환한다."""
     return cost_service
 
 
-def get_email_service():
+async def get_email_service():
     """EmailService 싱글턴을 반환한다."""
     return email_service
 
 
-def get_role_service():
+async def get_role_service():
     """RoleService 싱글턴을 반환한다."""
     return role_service
 
 
-def get_subscription_service():
+async def get_subscription_service():
     """SubscriptionService 싱글턴을 반환한다."""
     return subscription_service
 
 
-def get_workshop_service():
+async def get_workshop_service():
     """WorkshopService 싱글턴을 반환한다."""
     return workshop_service
 
@@ -75,7 +80,7 @@ def get_current_user(request: Request) -> Optional[dict[str, Any]]:
     return getattr(request.state, "user", None)
 
 
-def require_admin(request: Request) -> dict[str, Any]:
+async def require_admin(request: Request) -> dict[str, Any]:
     """현재 사용자가 Admin 역할인지 검증한다.
 
     Admin 전용 엔드포인트의 의존성으로 사용한다.
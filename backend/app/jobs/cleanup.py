@@ -14,13 +14,13 @@ from datetime import datetime, timedelta, timezone
 _KST = timezone(timedelta(hours=9))
 
 from app.config import settings
-from app.exceptions import PolicyNotFoundError
 from app.models import DeletionFailureItem
 from app.services.cost import cost_service
+from app.services.credential import close_shared_async_azure_credential
 from app.services.entra_id import entra_id_service
-from app.services.policy import policy_service
+from app.services.policy import close_policy_service, get_policy_service
 from app.services.resource_manager import resource_manager_service
-from app.services.storage import storage_service
+from app.services.storage import new_deletion_failure_id, storage_service
 from app.utils.logging import configure_logging
 
 # Policy assignment names (same as in workshop.py)
@@ -43,13 +43,11 @@ async def cleanup_expired_workshops() -> None:
     run_id = str(uuid.uuid4())[:8]
     logger.info("Starting cleanup job (run_id=%s)", run_id)
 
-    # 1. Fetch all workshops from Table Storage
-    all_workshops = await storage_service.list_all_workshops()
+    # 1-2. Stream workshops from Table Storage and keep the expired ones:
+    #      end_date(KST) + 1h < now(KST), status == 'active'
     now = datetime.now(_KST)
-
-    # 2. Filter expired workshops: end_date(KST) + 1h < now(KST), status == 'active'
     expired = []
-    for ws in all_workshops:
+    async for ws in storage_service.aiter_workshops():
         if ws.get("status", "active") not in CLEANABLE_STATUSES:
             continue
         end_date_str = ws.get("end_date", "")
@@ -169,35 +167,31 @@ async def _cleanup_single_workshop(workshop: dict) -> tuple[bool, list[str]]:
         if sub_id and sub_id not in seen_subs:
             seen_subs.add(sub_id)
             sub_scope = f"/subscriptions/{sub_id}"
-            sub_policy_ok = True
-            for assignment_name in (
-                WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
-                WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
-                WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
-            ):
-                try:
-                    await policy_service.delete_policy_assignment(
-                        scope=sub_scope,
-                        assignment_name=assignment_name,
-                        subscription_id=sub_id,
-                    )
-                except PolicyNotFoundError:
-                    # Already removed — treat as success
-                    pass
-                except Exception as e:
-                    sub_policy_ok = False
-                    error_msg = f"Failed to delete policy '{assignment_name}' on subscription '{sub_id}'"
-                    errors.append(error_msg)
-                    logger.warning("%s: %s", error_msg, e)
-                    await _save_failure(
-                        workshop_id=workshop_id,
-                        workshop_name=workshop_name,
-                        resource_type="policy",
-                        resource_name=assignment_name,
-                        subscription_id=sub_id,
-                        error_message=f"{error_msg}: {e}",
-                        failed_at=now_iso,
-                    )
+            # Delete the assignments concurrently (bounded); missing ones count as success
+            deleted = await get_policy_service().delete_policy_assignments(
+                scope=sub_scope,
+                assignment_names=(
+                    WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
+                    WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
+                    WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
+                ),
+                subscription_id=sub_id,
+            )
+            sub_policy_ok = all(deleted.values())
+            for assignment_name, ok in deleted.items():
+                if ok:
+                    continue
+                error_msg = f"Failed to delete policy '{assignment_name}' on subscription '{sub_id}'"
+                errors.append(error_msg)
+                await _save_failure(
+                    workshop_id=workshop_id,
+                    workshop_name=workshop_name,
+                    resource_type="policy",
+                    resource_name=assignment_name,
+                    subscription_id=sub_id,
+                    error_message=error_msg,
+                    failed_at=now_iso,
+                )
             policy_status[sub_id] = sub_policy_ok
             if sub_policy_ok:
                 logger.info("Removed policies from subscription %s", sub_id)
@@ -312,7 +306,7 @@ async def _save_failure(
     """Save a deletion failure record to Table Storage."""
     try:
         failure = DeletionFailureItem(
-            id=str(uuid.uuid4()),
+            id=new_deletion_failure_id(failed_at),
             workshop_id=workshop_id,
             workshop_name=workshop_name,
             resource_type=resource_type,
@@ -339,15 +333,31 @@ async def main() -> None:
 
 
 async def _close_service_clients() -> None:
-    """Close async SDK clients to prevent resource warnings."""
+    """Close async SDK clients to prevent resource warnings.
+
+    Mirrors the FastAPI lifespan shutdown in app.main: SDK sessions first,
+    then the shared async credential they authenticate with.
+    """
     for close_fn in (
-        lambda: storage_service.table_service_client.close(),
+        storage_service.close,
+        close_policy_service,
+        resource_manager_service.close,
     ):
         try:
             await close_fn()
         except Exception:
             pass
 
+    try:
+        cost_service.close()
+    except Exception:
+        pass
+
+    try:
+        await close_shared_async_azure_credential()
+    except Exception:
+        pass
+
 
 if __name__ == "__main__":
     asyncio.run(main())
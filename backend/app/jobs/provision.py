@@ -13,6 +13,10 @@ from datetime import datetime, timedelta, timezone
 _KST = timezone(timedelta(hours=9))
 
 from app.config import settings
+from app.services.cost import cost_service
+from app.services.credential import close_shared_async_azure_credential
+from app.services.policy import close_policy_service
+from app.services.resource_manager import resource_manager_service
 from app.services.storage import storage_service
 from app.services.workshop import WorkshopService
 from app.utils.logging import configure_logging
@@ -34,11 +38,10 @@ async def provision_scheduled_workshops() -> None:
     run_id = str(uuid.uuid4())[:8]
     logger.info("Starting provision job (run_id=%s)", run_id)
 
-    all_workshops = await storage_service.list_all_workshops()
     now = datetime.now(_KST)
 
     targets = []
-    for ws in all_workshops:
+    async for ws in storage_service.aiter_workshops():
         if ws.get("status") not in PROVISIONABLE_STATUSES:
             continue
 
@@ -162,15 +165,31 @@ async def main() -> None:
 
 
 async def _close_service_clients() -> None:
-    """Close async SDK clients to prevent resource warnings."""
+    """Close async SDK clients to prevent resource warnings.
+
+    Mirrors the FastAPI lifespan shutdown in app.main: SDK sessions first,
+    then the shared async credential they authenticate with.
+    """
     for close_fn in (
-        lambda: storage_service.table_service_client.close(),
+        storage_service.close,
+        close_policy_service,
+        resource_manager_service.close,
     ):
         try:
             await close_fn()
         except Exception:
             pass
 
+    try:
+        cost_service.close()
+    except Exception:
+        pass
+
+    try:
+        await close_shared_async_azure_credential()
+    except Exception:
+        pass
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -45,12 +45,49 @@ async def lifespan(app: FastAPI):
         settings.azure_subscription_id,
     )
 
+    # Warm up policy clients so the first workshop request skips token/TLS setup
+    try:
+        from app.services.policy import get_policy_service
+        await get_policy_service().warmup()
+    except Exception as e:
+        logger.warning("Policy client warmup skipped: %s", e)
+
+    try:
+        from app.services.storage import get_storage_service
+        await get_storage_service().warmup()
+    except Exception as e:
+        logger.warning("Table Storage warmup skipped: %s", e)
+
     yield
 
     # Gracefully close async Azure SDK sessions to suppress aiohttp warnings
     try:
-        from app.services.storage import storage_service
-        await storage_service.table_service_client.close()
+        from app.services.storage import get_storage_service
+        await get_storage_service().close()
+    except Exception:
+        pass
+
+    try:
+        from app.services.policy import close_policy_service
+        await close_policy_service()
+    except Exception:
+        pass
+
+    try:
+        from app.services.resource_manager import resource_manager_service
+        await resource_manager_service.close()
+    except Exception:
+        pass
+
+    try:
+        from app.services.cost import cost_service
+        cost_service.close()
+    except Exception:
+        pass
+
+    try:
+        from app.services.credential import close_shared_async_azure_credential
+        await close_shared_async_azure_credential()
     except Exception:
         pass
 
@@ -138,7 +175,7 @@ async def health_check():
     try:
         from app.services.storage import storage_service
 
-        await storage_service.list_all_workshops()
+        await storage_service.list_all_workshops(use_cache=False)
         dependencies["table_storage"] = "ok"
     except Exception as e:
         dependencies["table_storage"] = f"error: {type(e).__name__}"
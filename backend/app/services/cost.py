@@ -5,11 +5,14 @@
 Authentication: DefaultAzureCredential (OIDC/Managed Identity)
 """
 import asyncio
+import concurrent.futures
+import contextvars
+import functools
 import logging
 import random
 from datetime import UTC, datetime, timedelta
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 from azure.mgmt.costmanagement import CostManagementClient
 from azure.mgmt.costmanagement.models import (
@@ -36,10 +39,39 @@ _RETRY_BASE_DELAY_SECONDS = 2.0
 # Maximum concurrent Cost API requests to avoid 429 (rate limit)
 _COST_API_CONCURRENCY = 3
 
+# 동기 Cost SDK 호출 전용 스레드 수 (기본 executor 고갈 방지)
+_COST_EXECUTOR_MAX_WORKERS = 16
+
 # 워크샵 날짜는 KST(UTC+9) 기준으로 저장되므로 UTC 변환이 필요
 _KST_OFFSET = timedelta(hours=9)
 
 
+T = TypeVar("T")
+
+
+async def _to_thread_fast(
+    executor: concurrent.futures.Executor | None,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """asyncio.to_thread와 동일하나 빈 context에서는 ctx.run 래핑을 생략한다.
+
+    요청 컨텍스트 변수가 없으면 context 복사본을 거치지 않고 바로 실행한다.
+
+    Args:
+        executor: 실행할 executor. None이면 이벤트 루프 기본 executor.
+        func: 스레드에서 실행할 동기 함수.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(func, *args, **kwargs)
+    if not ctx:
+        return await loop.run_in_executor(executor, call)
+    return await loop.run_in_executor(executor, functools.partial(ctx.run, call))
+
+
 def _kst_naive_to_utc(dt: datetime) -> datetime:
     """KST 기준 나이브 datetime을 UTC 나이브 datetime으로 변환한다."""
     return dt - _KST_OFFSET
@@ -135,11 +167,23 @@ class CostService:
         try:
             self._credential = get_azure_credential()
             self._default_subscription_id = settings.azure_subscription_id
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_COST_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="azure-cost",
+            )
             logger.info("Initialized Cost Management service")
         except Exception as e:
             logger.error("Failed to initialize Cost Management client: %s", e)
             raise
 
+    def close(self) -> None:
+        """Cost SDK 전용 스레드 풀을 종료한다."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """동기 Cost SDK 호출을 전용 스레드 풀에서 실행한다."""
+        return await _to_thread_fast(self._executor, func, *args, **kwargs)
+
     def _get_cost_client(self) -> CostManagementClient:
         """CostManagementClient를 생성한다 (구독 비종속)."""
         return CostManagementClient(credential=self._credential)
@@ -173,7 +217,7 @@ class CostService:
             query = _build_cost_query(start_date, end_date)
 
             client = self._get_cost_client()
-            result = await asyncio.to_thread(
+            result = await self._run(
                 client.query.usage, scope=scope, parameters=query,
             )
             total_cost, currency = _sum_cost_rows(result)
@@ -303,7 +347,7 @@ class CostService:
         for attempt in range(_MAX_RETRIES + 1):
             try:
                 client = self._get_cost_client()
-                result = await asyncio.to_thread(
+                result = await self._run(
                     client.query.usage, scope=scope, parameters=query,
                 )
                 total_cost, currency = _sum_cost_rows(result)
@@ -5,6 +5,7 @@ Service Principal 환경변수가 설정되면 ClientSecretCredential을 사용
 그렇지 않으면 다음 순서로 자동 처리한다:
 - 로컬 개발: Azure CLI credential (``az login``)
 - 프로덕션: App Service/Container에 할당된 Managed Identity
+  (MANAGED_IDENTITY_CLIENT_ID 지정 시 체인 탐색 없이 바로 사용)
 """
 import logging
 
@@ -12,17 +13,27 @@ from azure.identity import (
     AzureCliCredential,
     ClientSecretCredential,
     DefaultAzureCredential,
+    ManagedIdentityCredential,
 )
 from azure.identity.aio import (
     AzureCliCredential as AsyncAzureCliCredential,
     ClientSecretCredential as AsyncClientSecretCredential,
     DefaultAzureCredential as AsyncDefaultAzureCredential,
+    ManagedIdentityCredential as AsyncManagedIdentityCredential,
 )
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_shared_async_credential: (
+    AsyncClientSecretCredential
+    | AsyncDefaultAzureCredential
+    | AsyncAzureCliCredential
+    | AsyncManagedIdentityCredential
+    | None
+) = None
+
 
 def _has_sp_config() -> bool:
     """Service Principal 환경변수가 모두 설정되어 있는지 확인한다."""
@@ -33,13 +44,15 @@ def _has_sp_config() -> bool:
     )
 
 
-def get_azure_credential() -> ClientSecretCredential | DefaultAzureCredential | AzureCliCredential:
+def get_azure_credential(
+) -> ClientSecretCredential | DefaultAzureCredential | AzureCliCredential | ManagedIdentityCredential:
     """호출 시마다 새 Azure credential 인스턴스를 생성한다.
 
     우선순위:
     1. Service Principal 환경변수 설정 시 → ClientSecretCredential
     2. USE_AZURE_CLI_CREDENTIAL=true 시 → AzureCliCredential
-    3. 그 외 → DefaultAzureCredential (Managed Identity 등)
+    3. MANAGED_IDENTITY_CLIENT_ID 설정 시 → ManagedIdentityCredential
+    4. 그 외 → DefaultAzureCredential (Managed Identity 등)
 
     Returns:
         Azure credential 객체.
@@ -60,6 +73,12 @@ def get_azure_credential() -> ClientSecretCredential | DefaultAzureCredential |
             logger.debug("Using AzureCliCredential (local development mode)")
             return AzureCliCredential()
 
+        if settings.managed_identity_client_id:
+            logger.debug("Using ManagedIdentityCredential (user-assigned)")
+            return ManagedIdentityCredential(
+                client_id=settings.managed_identity_client_id,
+            )
+
         logger.debug("Using DefaultAzureCredential")
         return DefaultAzureCredential(
             exclude_shared_token_cache_credential=True,
@@ -73,13 +92,19 @@ def get_azure_credential() -> ClientSecretCredential | DefaultAzureCredential |
 
 
 def get_async_azure_credential(
-) -> AsyncClientSecretCredential | AsyncDefaultAzureCredential | AsyncAzureCliCredential:
+) -> (
+    AsyncClientSecretCredential
+    | AsyncDefaultAzureCredential
+    | AsyncAzureCliCredential
+    | AsyncManagedIdentityCredential
+):
     """호출 시마다 새 비동기 Azure credential 인스턴스를 생성한다.
 
     우선순위:
     1. Service Principal 환경변수 설정 시 → ClientSecretCredential
     2. USE_AZURE_CLI_CREDENTIAL=true 시 → AzureCliCredential
-    3. 그 외 → DefaultAzureCredential (Managed Identity 등)
+    3. MANAGED_IDENTITY_CLIENT_ID 설정 시 → ManagedIdentityCredential
+    4. 그 외 → DefaultAzureCredential (Managed Identity 등)
 
     Returns:
         비동기 Azure credential 객체.
@@ -100,6 +125,12 @@ def get_async_azure_credential(
             logger.debug("Using AzureCliCredential (async) for local development")
             return AsyncAzureCliCredential()
 
+        if settings.managed_identity_client_id:
+            logger.debug("Using ManagedIdentityCredential (async, user-assigned)")
+            return AsyncManagedIdentityCredential(
+                client_id=settings.managed_identity_client_id,
+            )
+
         logger.debug("Using DefaultAzureCredential (async)")
         return AsyncDefaultAzureCredential(
             exclude_shared_token_cache_credential=True,
@@ -110,3 +141,33 @@ def get_async_azure_credential(
     except Exception as e:
         logger.error("Failed to create async Azure credential: %s", e)
         raise
+
+
+def get_shared_async_azure_credential(
+) -> (
+    AsyncClientSecretCredential
+    | AsyncDefaultAzureCredential
+    | AsyncAzureCliCredential
+    | AsyncManagedIdentityCredential
+):
+    """프로세스 전체에서 공유하는 비동기 Azure credential을 반환한다.
+
+    credential 인스턴스마다 토큰 캐시가 따로 존재하므로, 서비스들이 하나의
+    인스턴스를 공유하면 토큰 발급(az CLI 호출, IMDS 요청)이 한 번으로 줄어든다.
+    공유 credential은 개별 서비스가 아닌 애플리케이션 종료 시점에 닫는다.
+
+    Returns:
+        공유 비동기 Azure credential 객체.
+    """
+    global _shared_async_credential
+    if _shared_async_credential is None:
+        _shared_async_credential = get_async_azure_credential()
+    return _shared_async_credential
+
+
+async def close_shared_async_azure_credential() -> None:
+    """공유 비동기 credential의 HTTP 세션을 닫는다."""
+    global _shared_async_credential
+    credential, _shared_async_credential = _shared_async_credential, None
+    if credential is not None:
+        await credential.close()
@@ -6,9 +6,9 @@ DefaultAzureCredential(OIDC/Managed Identity)을 사용하여 인증한다.
 """
 import asyncio
 import logging
-import uuid
-from functools import lru_cache
-from typing import Any
+import secrets
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from azure.core.exceptions import (
     AzureError,
@@ -17,9 +17,6 @@ from azure.core.exceptions import (
     ResourceNotFoundError,
     ServiceRequestError,
 )
-from azure.mgmt.resource.policy.aio import PolicyClient
-from azure.mgmt.resource.policy.models import PolicyAssignment
-
 from app.config import settings
 from app.exceptions import (
     AzureAuthenticationError,
@@ -27,7 +24,12 @@ from app.exceptions import (
     PolicyNotFoundError,
     PolicyServiceError,
 )
-from app.services.credential import get_async_azure_credential
+from app.services.credential import get_shared_async_azure_credential
+
+if TYPE_CHECKING:
+    # Policy SDK는 import 비용이 커서 실제 사용 시점에 로드한다
+    from azure.mgmt.resource.policy.aio import PolicyClient
+    from azure.mgmt.resource.policy.models import PolicyAssignment
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,18 @@ WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT = "workshop-allowed-locations"
 WORKSHOP_DENIED_RESOURCES_ASSIGNMENT = "workshop-denied-resources"
 WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT = "workshop-allowed-vm-skus"
 
+# 시작 시 PolicyClient 준비에 쓰는 최대 시간(초). 넘기면 준비를 건너뛴다
+_WARMUP_TIMEOUT_SECONDS = 10
+
+# display_name 미리보기에 포함할 최대 항목 수
+_DISPLAY_PREVIEW_COUNT = 3
+
+
+def _preview(items: list[str]) -> str:
+    """display_name용 미리보기 문자열을 만든다 (최대 3개, 초과 시 '...')."""
+    suffix = "..." if len(items) > _DISPLAY_PREVIEW_COUNT else ""
+    return ", ".join(items[:_DISPLAY_PREVIEW_COUNT]) + suffix
+
 
 class PolicyService:
     """Azure Policy 할당/삭제/조회를 관리하는 서비스.
@@ -46,6 +60,8 @@ class PolicyService:
         DENIED_RESOURCE_TYPES_POLICY_ID: 차단 리소스 타입 정책 정의 ID.
     """
 
+    __slots__ = ("_credential", "_default_subscription_id", "_clients")
+
     ALLOWED_LOCATIONS_POLICY_ID = (
         "/providers/Microsoft.Authorization/policyDefinitions/"
         "e56962a6-4747-49cd-b67b-bf8b01975c4c"
@@ -59,6 +75,18 @@ class PolicyService:
         "cccc23c7-8427-4f53-ad12-b6a63eb452b3"
     )
 
+    # 호출마다 변하지 않는 PolicyAssignment 생성자 인자
+    _LOC_BASE_KW = MappingProxyType({
+        "policy_definition_id": ALLOWED_LOCATIONS_POLICY_ID,
+        "description": "Restricts resource deployment to allowed regions",
+    })
+    _RT_BASE_KW = MappingProxyType({
+        "policy_definition_id": DENIED_RESOURCE_TYPES_POLICY_ID,
+    })
+    _SKU_BASE_KW = MappingProxyType({
+        "policy_definition_id": ALLOWED_VM_SKUS_POLICY_ID,
+    })
+
     def __init__(self) -> None:
         """Azure Identity를 사용하여 PolicyService를 초기화한다.
 
@@ -67,8 +95,9 @@ class PolicyService:
             PolicyServiceError: 기타 초기화 실패 시.
         """
         try:
-            self._credential = get_async_azure_credential()
+            self._credential = get_shared_async_azure_credential()
             self._default_subscription_id = settings.azure_subscription_id
+            self._clients: dict[str, "PolicyClient"] = {}
             logger.info("PolicyService initialized successfully")
         except ClientAuthenticationError as e:
             logger.error("Authentication failed during PolicyService initialization")
@@ -81,21 +110,66 @@ class PolicyService:
                 "Failed to initialize PolicyService"
             ) from e
 
-    def _get_policy_client(self, subscription_id: str | None = None) -> PolicyClient:
-        """특정 구독의 PolicyClient를 반환한다."""
+    async def __aenter__(self) -> "PolicyService":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """캐시된 PolicyClient의 HTTP 세션을 닫는다.
+
+        공유 credential은 애플리케이션 종료 시 별도로 닫는다.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning("Failed to close PolicyClient: %s", e)
+
+    def _get_policy_client(self, subscription_id: str | None = None) -> "PolicyClient":
+        """특정 구독의 PolicyClient를 반환한다.
+
+        구독별로 클라이언트를 캐시하여 aiohttp 세션과 커넥션 풀을 재사용한다.
+        """
         sub_id = subscription_id or self._default_subscription_id
-        return PolicyClient(credential=self._credential, subscription_id=sub_id)
+        client = self._clients.get(sub_id)
+        if client is None:
+            from azure.mgmt.resource.policy.aio import PolicyClient
+
+            client = PolicyClient(credential=self._credential, subscription_id=sub_id)
+            self._clients[sub_id] = client
+        return client
+
+    async def warmup(self) -> None:
+        """기본 구독의 PolicyClient를 미리 생성하고 토큰/커넥션을 확보한다.
 
-    @property
-    def _policy_client(self) -> PolicyClient:
-        """기본 구독용 PolicyClient (하위 호환성)."""
-        return self._get_policy_client()
+        첫 사용자 요청에서 발생하는 토큰 발급과 TLS 핸드셰이크 지연을
+        애플리케이션 시작 시점으로 옮긴다. 토큰은 구독과 무관하게 공유되므로
+        기본 구독 하나만 준비하며, 시작이 지연되지 않도록 시간을 제한한다.
+        실패와 시간 초과는 로그만 남긴다.
+        """
+        sub_id = self._default_subscription_id
+        if not sub_id:
+            return
+
+        async def _warm() -> None:
+            client = self._get_policy_client(sub_id)
+            async for _ in client.policy_assignments.list():
+                break
+
+        try:
+            await asyncio.wait_for(_warm(), timeout=_WARMUP_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.warning("PolicyClient warmup failed for %s: %r", sub_id, e)
 
     async def _create_assignment(
         self,
         scope: str,
         assignment_name: str,
-        assignment: PolicyAssignment,
+        assignment: "PolicyAssignment",
         policy_type: str,
         subscription_id: str | None = None,
     ) -> dict[str, Any]:
@@ -167,16 +241,14 @@ class PolicyService:
             raise PolicyAssignmentError("At least one location must be specified")
 
         if not assignment_name:
-            assignment_name = f"allowed-locations-{uuid.uuid4().hex[:8]}"
+            assignment_name = f"allowed-locations-{secrets.token_hex(4)}"
 
-        location_preview = ", ".join(allowed_locations[:3])
-        ellipsis_suffix = "..." if len(allowed_locations) > 3 else ""
+        from azure.mgmt.resource.policy.models import PolicyAssignment
 
         assignment = PolicyAssignment(
-            display_name=f"Allowed Locations: {location_preview}{ellipsis_suffix}",
-            policy_definition_id=self.ALLOWED_LOCATIONS_POLICY_ID,
+            **self._LOC_BASE_KW,
+            display_name=f"Allowed Locations: {_preview(allowed_locations)}",
             parameters={"listOfAllowedLocations": {"value": allowed_locations}},
-            description="Restricts resource deployment to allowed regions",
         )
 
         result = await self._create_assignment(
@@ -216,12 +288,14 @@ class PolicyService:
             return {"skipped": True, "reason": "No denied resource types provided"}
 
         if not assignment_name:
-            assignment_name = f"denied-resources-{uuid.uuid4().hex[:8]}"
+            assignment_name = f"denied-resources-{secrets.token_hex(4)}"
 
         type_count = len(denied_resource_types)
+        from azure.mgmt.resource.policy.models import PolicyAssignment
+
         assignment = PolicyAssignment(
+            **self._RT_BASE_KW,
             display_name=f"Not Allowed Resource Types ({type_count} types)",
-            policy_definition_id=self.DENIED_RESOURCE_TYPES_POLICY_ID,
             parameters={"listOfResourceTypesNotAllowed": {"value": denied_resource_types}},
             description=f"Denies deployment of {type_count} resource types",
         )
@@ -263,15 +337,15 @@ class PolicyService:
             raise PolicyAssignmentError("At least one VM SKU must be specified")
 
         if not assignment_name:
-            assignment_name = f"allowed-vm-skus-{uuid.uuid4().hex[:8]}"
+            assignment_name = f"allowed-vm-skus-{secrets.token_hex(4)}"
 
-        sku_preview = ", ".join(allowed_vm_skus[:3])
-        ellipsis_suffix = "..." if len(allowed_vm_skus) > 3 else ""
         sku_count = len(allowed_vm_skus)
 
+        from azure.mgmt.resource.policy.models import PolicyAssignment
+
         assignment = PolicyAssignment(
-            display_name=f"Allowed VM SKUs: {sku_preview}{ellipsis_suffix}",
-            policy_definition_id=self.ALLOWED_VM_SKUS_POLICY_ID,
+            **self._SKU_BASE_KW,
+            display_name=f"Allowed VM SKUs: {_preview(allowed_vm_skus)}",
             parameters={"listOfAllowedSKUs": {"value": allowed_vm_skus}},
             description=f"Restricts VM deployment to {sku_count} allowed SKU(s)",
         )
@@ -308,40 +382,40 @@ class PolicyService:
         Returns:
             location_policy와 resource_types_policy 결과 딕셔너리.
         """
+        async def _safe(key: str, coro) -> dict[str, Any] | None:
+            """할당 실패를 None으로 변환하고 traceback과 함께 로깅한다."""
+            try:
+                return await coro
+            except Exception:
+                logger.exception("Failed to assign %s", key)
+                return None
+
         tasks = [
-            self.assign_location_policy(
+            _safe("location_policy", self.assign_location_policy(
                 scope, allowed_locations,
                 assignment_name=WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
                 subscription_id=subscription_id,
-            ),
-            self.assign_denied_resource_types_policy(
+            )),
+            _safe("resource_types_policy", self.assign_denied_resource_types_policy(
                 scope, denied_resource_types,
                 assignment_name=WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
                 subscription_id=subscription_id,
-            ),
+            )),
         ]
         policy_keys = ["location_policy", "resource_types_policy"]
 
         if allowed_vm_skus:
             tasks.append(
-                self.assign_allowed_vm_skus_policy(
+                _safe("vm_skus_policy", self.assign_allowed_vm_skus_policy(
                     scope, allowed_vm_skus,
                     assignment_name=WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
                     subscription_id=subscription_id,
-                )
+                ))
             )
             policy_keys.append("vm_skus_policy")
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        policies: dict[str, Any] = {}
-
-        for key, result in zip(policy_keys, results):
-            if isinstance(result, Exception):
-                logger.error("Failed to assign %s: %s", key, result)
-                policies[key] = None
-            else:
-                policies[key] = result
+        results = await asyncio.gather(*tasks)
+        policies: dict[str, Any] = dict(zip(policy_keys, results))
 
         return policies
 
@@ -387,22 +461,85 @@ class PolicyService:
                 "Authentication failed. Please re-authenticate."
             ) from e
         except AzureError as e:
-            logger.error("Azure error during policy deletion: %s", type(e).__name__)
+            # 전체 응답 본문은 로그에만 남기고 예외 메시지는 짧게 유지한다
+            logger.error(
+                "Azure error during policy deletion: %s", type(e).__name__, exc_info=True
+            )
+            message = getattr(e, "message", None) or (
+                e.args[0] if e.args else type(e).__name__
+            )
             raise PolicyServiceError(
-                f"Failed to delete policy assignment: {str(e)}"
+                f"Failed to delete policy assignment: {message}"
             ) from e
 
+    async def delete_policy_assignments(
+        self,
+        scope: str,
+        assignment_names: list[str] | tuple[str, ...],
+        subscription_id: str | None = None,
+        max_concurrent: int = 8,
+    ) -> dict[str, bool]:
+        """여러 정책 할당을 동시 실행 수를 제한하여 병렬로 삭제한다.
+
+        이미 존재하지 않는 할당은 성공으로 처리하며, 개별 실패는
+        예외를 발생시키지 않고 결과에 False로 표시한다.
+
+        Args:
+            scope: 리소스 범위.
+            assignment_names: 삭제할 정책 할당 이름 목록.
+            subscription_id: 대상 구독 ID. 미지정 시 기본 구독 사용.
+            max_concurrent: 최대 동시 삭제 요청 수.
+
+        Returns:
+            정책 할당 이름별 삭제 성공 여부 매핑.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _delete_one(name: str) -> bool:
+            async with semaphore:
+                try:
+                    return await self.delete_policy_assignment(
+                        scope, name, subscription_id,
+                    )
+                except PolicyNotFoundError:
+                    # Already removed — treat as success
+                    return True
+                except Exception as e:
+                    logger.warning(
+                        "Failed to remove policy %s on %s: %s", name, scope, e,
+                    )
+                    return False
+
+        results = await asyncio.gather(
+            *(_delete_one(name) for name in assignment_names)
+        )
+        return dict(zip(assignment_names, results))
+
+
+_policy_service_singleton: PolicyService | None = None
+
 
-@lru_cache(maxsize=1)
 def get_policy_service() -> PolicyService:
     """PolicyService 싱글턴 인스턴스를 반환한다.
 
-    @lru_cache를 통해 스레드 안전한 싱글턴 패턴을 구현한다.
+    최초 호출 시 한 번만 생성하고 이후에는 모듈 전역 인스턴스를 재사용한다.
+    생성 과정에 await가 없으므로 이벤트 루프 내에서 별도 잠금이 필요 없다.
 
     Returns:
         PolicyService 싱글턴 인스턴스.
     """
-    return PolicyService()
+    global _policy_service_singleton
+    if _policy_service_singleton is None:
+        _policy_service_singleton = PolicyService()
+    return _policy_service_singleton
 
 
-policy_service = get_policy_service()
+async def close_policy_service() -> None:
+    """PolicyService 싱글턴이 생성된 경우에만 닫는다.
+
+    한 번도 사용하지 않은 프로세스에서 종료만을 위해 클라이언트를 만들지 않는다.
+    """
+    global _policy_service_singleton
+    service, _policy_service_singleton = _policy_service_singleton, None
+    if service is not None:
+        await service.close()
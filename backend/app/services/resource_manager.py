@@ -8,13 +8,16 @@ import asyncio
 import json
 import logging
 import os
+import random
 import re
+import secrets
 import shutil
 import tempfile
 import time
 import uuid
+from contextlib import asynccontextmanager
 from functools import lru_cache
-from typing import Any
+from typing import Any, AsyncIterator
 
 from azure.core.exceptions import ResourceNotFoundError
 from azure.mgmt.authorization.aio import AuthorizationManagementClient
@@ -29,12 +32,46 @@ from azure.mgmt.resource.resources.models import (
 )
 
 from app.config import settings
-from app.services.credential import get_async_azure_credential
+from app.services.credential import get_shared_async_azure_credential
+from app.services.transport import TunedAioHttpTransport, azure_retry_policy
 
 logger = logging.getLogger(__name__)
 
 _RESOURCE_TYPES_CACHE_TTL = 86400  # 24시간
+# 갱신이 계속 실패할 때 만료된 리소스 타입을 제공하는 최대 기간 (조회 시점부터 TTL의 7배)
+_RESOURCE_TYPES_STALE_LIMIT = 7 * _RESOURCE_TYPES_CACHE_TTL
+# 레플리카들이 같은 시점에 일제히 갱신하지 않도록 TTL에 더하는 비율 (±10%)
+_RESOURCE_TYPES_TTL_JITTER = 0.1
+# 프로바이더 조회가 실패한 네임스페이스의 재시도 대기 시간. 연속 실패마다 두 배로 늘린다
+_RESOURCE_TYPES_RETRY_TTL = 60
+_RESOURCE_TYPES_RETRY_TTL_MAX = 3600
 _VM_SKUS_CACHE_TTL = 86400  # 24시간
+_ROLE_DEFINITION_CACHE_TTL = 12 * 3600  # 12시간
+
+# Azure 기본 제공 역할의 고정 GUID (모든 테넌트/구독에서 동일)
+_BUILTIN_ROLE_IDS: dict[str, str] = {
+    "Owner": "8e3af657-a8ff-443c-a75c-2fe8c4bcb635",
+    "Contributor": "b24988ac-6180-42a0-ab88-20f7382dd24c",
+    "Reader": "acdd72a7-3385-48ef-bd42-f606fba81ae7",
+    "User Access Administrator": "18d7d88d-d35e-4fb5-a5c3-7773c20a72d9",
+    "Role Based Access Control Administrator": "f58310d9-a9f6-439a-9e8d-f62e7b41a168",
+    "Virtual Machine Contributor": "9980e02c-c2be-4d73-94e8-173b1dc7cf3c",
+    "Network Contributor": "4d97b98b-1d4f-4787-a291-c67834d212e7",
+    "Storage Account Contributor": "17d1049b-9a84-46fb-8f53-869881c3d3ab",
+    "Storage Blob Data Owner": "b7e6dc6d-f1e8-4753-8033-0f276bb0955b",
+    "Storage Blob Data Contributor": "ba92f5b4-2d11-453d-a403-e96b0029c9fe",
+    "Storage Blob Data Reader": "2a2b9908-6ea1-4ae2-8e65-a410df84e7d1",
+    "Key Vault Administrator": "00482a5a-887f-4fb3-b363-3b7fe8e74483",
+    "Key Vault Secrets User": "4633458b-17de-408a-b874-0445c86b69e6",
+}
+
+# CamelCase 리소스 타입 이름의 단어 경계 (virtualMachines -> virtual Machines)
+_CAMEL_SPLIT_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+@lru_cache(maxsize=64)
+def _sub_scope(subscription_id: str) -> str:
+    """구독 범위 문자열(/subscriptions/{id})을 반환한다."""
+    return f"/subscriptions/{subscription_id}"
 
 
 class ResourceManagerService:
@@ -44,9 +81,19 @@ class ResourceManagerService:
     네이티브 비동기 클라이언트를 사용하여 Non-blocking I/O를 제공한다.
     """
 
-    _resource_types_cache: dict[str, dict[str, str]] = {}
-    _resource_types_cache_time: float = 0
-    _role_definition_cache: dict[tuple[str, str], str] = {}
+    _resource_types_cache: list[dict[str, str]] = []
+    # 만료 시각은 time.monotonic() 기준 (시스템 시계 변경에 영향받지 않음)
+    _resource_types_expires_at: float = 0.0
+    # 전체 캐시에 포함된 데이터 중 가장 오래된 조회 시각 (stale 한도 판단용)
+    _resource_types_fetched_at: float = 0.0
+    # 네임스페이스 -> (리소스 타입 목록, 조회 시각, 만료 시각)
+    _provider_types_cache: dict[str, tuple[list[dict[str, str]], float, float]] = {}
+    # 조회 실패 네임스페이스 -> (연속 실패 횟수, 재시도 가능 시각). time.monotonic() 기준
+    _provider_types_failures: dict[str, tuple[int, float]] = {}
+    _resource_types_lock = asyncio.Lock()
+    _resource_types_refresh_task: asyncio.Task | None = None
+    # (구독, 역할 이름) -> (역할 정의 ID, 저장 시각). 저장 시각은 time.monotonic() 기준
+    _role_definition_cache: dict[tuple[str, str], tuple[str, float]] = {}
     _vm_skus_cache: dict[str, list[dict[str, Any]]] = {}
     _vm_skus_cache_time: dict[str, float] = {}
     _common_vm_skus_cache: dict[str, list[dict[str, Any]]] = {}
@@ -55,36 +102,86 @@ class ResourceManagerService:
     def __init__(self) -> None:
         """Azure Resource Manager 서비스를 초기화한다."""
         try:
-            self._credential = get_async_azure_credential()
+            self._credential = get_shared_async_azure_credential()
             self._default_subscription_id = settings.azure_subscription_id
+            self._resource_clients: dict[str, ResourceManagementClient] = {}
+            self._auth_clients: dict[str, AuthorizationManagementClient] = {}
+            self._compute_clients: dict[str, ComputeManagementClient] = {}
+            # 모든 클라이언트가 하나의 커넥션 풀을 공유한다
+            self._transport = TunedAioHttpTransport()
+            self._bulk_semaphore = asyncio.Semaphore(settings.azure_bulk_concurrency)
             logger.info("Initialized async Resource Manager service")
         except Exception as e:
             logger.error("Failed to initialize Resource Manager client: %s", e)
             raise
 
+    async def close(self) -> None:
+        """캐시된 Azure 클라이언트의 HTTP 세션을 닫는다.
+
+        공유 credential은 애플리케이션 종료 시 별도로 닫는다.
+        """
+        clients = [
+            *self._resource_clients.values(),
+            *self._auth_clients.values(),
+            *self._compute_clients.values(),
+        ]
+        self._resource_clients.clear()
+        self._auth_clients.clear()
+        self._compute_clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning("Failed to close %s: %s", type(client).__name__, e)
+        await self._transport.close()
+
     def _get_resource_client(
         self, subscription_id: str | None = None,
     ) -> ResourceManagementClient:
-        """특정 구독의 비동기 ResourceManagementClient를 반환한다."""
+        """특정 구독의 비동기 ResourceManagementClient를 반환한다.
+
+        구독별로 클라이언트를 캐시하여 HTTP 파이프라인과 커넥션 풀을 재사용한다.
+        """
         sub_id = subscription_id or self._default_subscription_id
-        return ResourceManagementClient(
-            credential=self._credential,
-            subscription_id=sub_id,
-            retry_total=settings.azure_retry_total,
-            retry_backoff_factor=settings.azure_retry_backoff_factor,
-        )
+        client = self._resource_clients.get(sub_id)
+        if client is None:
+            client = ResourceManagementClient(
+                credential=self._credential,
+                subscription_id=sub_id,
+                retry_policy=azure_retry_policy(),
+                transport=self._transport,
+            )
+            self._resource_clients[sub_id] = client
+        return client
 
     def _get_auth_client(
         self, subscription_id: str | None = None,
     ) -> AuthorizationManagementClient:
-        """특정 구독의 비동기 AuthorizationManagementClient를 반환한다."""
+        """특정 구독의 비동기 AuthorizationManagementClient를 반환한다.
+
+        구독별로 클라이언트를 캐시하여 HTTP 파이프라인과 커넥션 풀을 재사용한다.
+        """
         sub_id = subscription_id or self._default_subscription_id
-        return AuthorizationManagementClient(
-            credential=self._credential,
-            subscription_id=sub_id,
-            retry_total=settings.azure_retry_total,
-            retry_backoff_factor=settings.azure_retry_backoff_factor,
-        )
+        client = self._auth_clients.get(sub_id)
+        if client is None:
+            client = AuthorizationManagementClient(
+                credential=self._credential,
+                subscription_id=sub_id,
+                retry_policy=azure_retry_policy(),
+                transport=self._transport,
+            )
+            self._auth_clients[sub_id] = client
+        return client
+
+    @asynccontextmanager
+    async def _arm_slot(self) -> AsyncIterator[None]:
+        """벌크 작업의 ARM 호출 슬롯을 확보한다.
+
+        참가자마다 구독이 달라 구독별 상한은 의미가 없으므로, 모든 구독을
+        합산한 전체 상한(settings.azure_bulk_concurrency) 하나만 적용한다.
+        """
+        async with self._bulk_semaphore:
+            yield
 
     async def create_resource_group(
         self,
@@ -104,9 +201,12 @@ class ResourceManagerService:
         Returns:
             리소스 그룹 상세 정보.
         """
+        sub_id = subscription_id or self._default_subscription_id
         try:
-            resource_client = self._get_resource_client(subscription_id)
+            resource_client = self._get_resource_client(sub_id)
             rg_params = ResourceGroup(location=location, tags=tags or {})
+            # 429/5xx는 클라이언트의 JitteredAsyncRetryPolicy가 재시도한다
+            # (백오프 지터, Retry-After는 azure_retry_backoff_max로 제한)
             rg = await resource_client.resource_groups.create_or_update(
                 resource_group_name=name,
                 parameters=rg_params,
@@ -114,7 +214,7 @@ class ResourceManagerService:
 
             logger.info(
                 "Created resource group: %s in %s (subscription: %s)",
-                name, location, subscription_id or 'default'
+                name, location, sub_id
             )
 
             return {
@@ -122,36 +222,43 @@ class ResourceManagerService:
                 'location': rg.location,
                 'id': rg.id,
                 'tags': rg.tags,
-                'subscription_id': subscription_id or self._default_subscription_id
+                'subscription_id': sub_id
             }
 
         except Exception as e:
             logger.error("Failed to create resource group %s: %s", name, e)
             raise
 
+    async def _create_resource_group_bounded(
+        self, rg: dict[str, Any],
+    ) -> dict[str, Any]:
+        """ARM 동시 요청 제한 안에서 리소스 그룹 하나를 생성한다."""
+        async with self._arm_slot():
+            return await self.create_resource_group(
+                name=rg['name'],
+                location=rg['location'],
+                tags=rg.get('tags'),
+                subscription_id=rg.get('subscription_id')
+            )
+
     async def create_resource_groups_bulk(
         self,
         resource_groups: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """여러 리소스 그룹을 병렬로 생성한다.
 
+        동시 요청 수는 전체 상한으로 제한한다 (_arm_slot 참고).
+
         Args:
             resource_groups: name, location, tags, subscription_id를 포함하는 딕셔너리 목록.
 
         Returns:
-            성공적으로 생성된 리소스 그룹 목록.
+            성공적으로 생성된 리소스 그룹 목록 (입력 순서 유지).
         """
-        tasks = [
-            self.create_resource_group(
-                name=rg['name'],
-                location=rg['location'],
-                tags=rg.get('tags'),
-                subscription_id=rg.get('subscription_id')
-            )
-            for rg in resource_groups
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(self._create_resource_group_bounded(rg) for rg in resource_groups),
+            return_exceptions=True,
+        )
 
         created_rgs = []
         for i, result in enumerate(results):
@@ -211,15 +318,17 @@ class ResourceManagerService:
             resource_groups: name, subscription_id를 포함하는 딕셔너리 목록.
             tags: 업데이트할 태그 딕셔너리.
         """
-        tasks = [
-            self.update_resource_group_tags(
-                name=rg["name"],
-                tags=tags,
-                subscription_id=rg.get("subscription_id"),
-            )
-            for rg in resource_groups
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        async def _bounded(rg: dict[str, Any]) -> None:
+            async with self._arm_slot():
+                await self.update_resource_group_tags(
+                    name=rg["name"],
+                    tags=tags,
+                    subscription_id=rg.get("subscription_id"),
+                )
+
+        await asyncio.gather(
+            *(_bounded(rg) for rg in resource_groups), return_exceptions=True,
+        )
 
     async def delete_resource_group(
         self, name: str, subscription_id: str | None = None,
@@ -237,7 +346,8 @@ class ResourceManagerService:
         """
         try:
             resource_client = self._get_resource_client(subscription_id)
-            await resource_client.resource_groups.begin_delete(name)
+            # 삭제 완료를 기다리지 않으므로 poller 대신 초기 응답만 받는다
+            await resource_client.resource_groups.begin_delete(name, polling=False)
             logger.info(
                 "Started deletion of resource group: %s (subscription: %s)",
                 name, subscription_id or 'default'
@@ -265,6 +375,8 @@ class ResourceManagerService:
         삭제를 완료하는 경우가 있다. 이를 방지하기 위해 실패로 보고된
         리소스 그룹의 존재 여부를 재확인한 후 최종 상태를 결정한다.
 
+        동시 요청 수는 전체 상한으로 제한한다 (_arm_slot 참고).
+
         Args:
             resource_groups: name과 선택적 subscription_id를 포함하는 딕셔너리 목록.
 
@@ -274,14 +386,16 @@ class ResourceManagerService:
         if resource_groups and isinstance(resource_groups[0], str):
             resource_groups = [{'name': name} for name in resource_groups]
 
-        tasks = [
-            self.delete_resource_group(
-                name=rg['name'],
-                subscription_id=rg.get('subscription_id')
-            )
-            for rg in resource_groups
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def _bounded(rg: dict[str, Any]) -> bool:
+            async with self._arm_slot():
+                return await self.delete_resource_group(
+                    name=rg['name'],
+                    subscription_id=rg.get('subscription_id')
+                )
+
+        results = await asyncio.gather(
+            *(_bounded(rg) for rg in resource_groups), return_exceptions=True,
+        )
 
         status = {}
         for i, result in enumerate(results):
@@ -396,8 +510,9 @@ class ResourceManagerService:
     ) -> str:
         """역할 이름으로 역할 정의 ID를 조회한다.
 
+        기본 제공 역할은 고정 GUID로 ID를 바로 구성한다. 그 외(사용자 지정 역할)는
         OData 필터를 사용하여 서버 측에서 필터링하고,
-        클래스 레벨 캐시로 반복 조회를 방지한다.
+        클래스 레벨 캐시(12시간 TTL)로 반복 조회를 방지한다.
 
         Args:
             role_name: Azure RBAC 역할 이름.
@@ -410,20 +525,30 @@ class ResourceManagerService:
             ValueError: 역할을 찾을 수 없는 경우.
         """
         sub_id = subscription_id or self._default_subscription_id
+
+        builtin_id = _BUILTIN_ROLE_IDS.get(role_name)
+        if builtin_id:
+            return (
+                f"{_sub_scope(sub_id)}/providers/Microsoft.Authorization"
+                f"/roleDefinitions/{builtin_id}"
+            )
+
         cache_key = (sub_id, role_name)
 
         cached = ResourceManagerService._role_definition_cache.get(cache_key)
-        if cached:
-            return cached
+        if cached and (time.monotonic() - cached[1]) < _ROLE_DEFINITION_CACHE_TTL:
+            return cached[0]
 
-        scope = f"/subscriptions/{sub_id}"
-        auth_client = self._get_auth_client(subscription_id)
+        scope = _sub_scope(sub_id)
+        auth_client = self._get_auth_client(sub_id)
         odata_filter = f"roleName eq '{role_name}'"
 
         async for role_def in auth_client.role_definitions.list(
             scope, filter=odata_filter,
         ):
-            ResourceManagerService._role_definition_cache[cache_key] = role_def.id
+            ResourceManagerService._role_definition_cache[cache_key] = (
+                role_def.id, time.monotonic(),
+            )
             return role_def.id
 
         raise ValueError(f"Role '{role_name}' not found")
@@ -449,7 +574,8 @@ class ResourceManagerService:
             배포 상세 정보.
         """
         if not deployment_name:
-            deployment_name = f"deployment-{uuid.uuid4().hex[:8]}"
+            # 여러 워커 프로세스가 같은 리소스 그룹에 배포해도 겹치지 않도록 무작위 접미사
+            deployment_name = f"deployment-{secrets.token_hex(4)}"
 
         try:
             resource_client = self._get_resource_client(subscription_id)
@@ -463,6 +589,7 @@ class ResourceManagerService:
                 resource_group_name=resource_group_name,
                 deployment_name=deployment_name,
                 parameters=deployment_params,
+                polling_interval=settings.azure_lro_poll_interval,
             )
             result = await poller.result()
 
@@ -482,6 +609,35 @@ class ResourceManagerService:
             logger.error("Failed to deploy template: %s", e)
             raise
 
+    async def iter_resources_in_group(
+        self,
+        resource_group_name: str,
+        subscription_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """리소스 그룹 내 리소스를 페이지 단위로 받아 하나씩 반환한다.
+
+        전체 목록을 메모리에 올리지 않고 SDK 페이지를 순회하며 변환한다.
+
+        Args:
+            resource_group_name: 리소스 그룹 이름.
+            subscription_id: 대상 구독 ID. 미지정 시 기본 구독 사용.
+
+        Yields:
+            리소스 정보 딕셔너리.
+        """
+        resource_client = self._get_resource_client(subscription_id)
+        async for resource in resource_client.resources.list_by_resource_group(
+            resource_group_name=resource_group_name
+        ):
+            yield {
+                'id': resource.id,
+                'name': resource.name,
+                'type': resource.type,
+                'location': resource.location,
+                'tags': resource.tags or {},
+                'provisioning_state': resource.provisioning_state,
+            }
+
     async def list_resources_in_group(
         self,
         resource_group_name: str,
@@ -497,25 +653,10 @@ class ResourceManagerService:
             리소스 목록.
         """
         try:
-            resource_client = self._get_resource_client(subscription_id)
-            resources = [
-                r async for r in resource_client.resources.list_by_resource_group(
-                    resource_group_name=resource_group_name
-                )
-            ]
-
             return [
-                {
-                    'id': resource.id,
-                    'name': resource.name,
-                    'type': resource.type,
-                    'location': resource.location,
-                    'tags': resource.tags or {},
-                    'provisioning_state': getattr(
-                        resource, 'provisioning_state', None
-                    )
-                }
-                for resource in resources
+                resource async for resource in self.iter_resources_in_group(
+                    resource_group_name, subscription_id,
+                )
             ]
 
         except Exception as e:
@@ -525,12 +666,21 @@ class ResourceManagerService:
     def _get_compute_client(
         self, subscription_id: str | None = None,
     ) -> ComputeManagementClient:
-        """특정 구독의 비동기 ComputeManagementClient를 반환한다."""
+        """특정 구독의 비동기 ComputeManagementClient를 반환한다.
+
+        구독별로 클라이언트를 캐시하여 HTTP 파이프라인과 커넥션 풀을 재사용한다.
+        """
         sub_id = subscription_id or self._default_subscription_id
-        return ComputeManagementClient(
-            credential=self._credential,
-            subscription_id=sub_id,
-        )
+        client = self._compute_clients.get(sub_id)
+        if client is None:
+            client = ComputeManagementClient(
+                credential=self._credential,
+                subscription_id=sub_id,
+                retry_policy=azure_retry_policy(),
+                transport=self._transport,
+            )
+            self._compute_clients[sub_id] = client
+        return client
 
     async def list_vm_skus(
         self,
@@ -560,40 +710,40 @@ class ResourceManagerService:
 
         try:
             logger.info("Fetching VM SKUs from Azure for location: %s", location)
-            async with self._get_compute_client(subscription_id) as compute_client:
-                skus: list[dict[str, Any]] = []
-
-                async for sku in compute_client.resource_skus.list(
-                    filter=f"location eq '{location}'"
-                ):
-                    # VM 관련 SKU만 필터링
-                    if sku.resource_type != "virtualMachines":
-                        continue
+            compute_client = self._get_compute_client(subscription_id)
+            skus: list[dict[str, Any]] = []
+
+            async for sku in compute_client.resource_skus.list(
+                filter=f"location eq '{location}'"
+            ):
+                # VM 관련 SKU만 필터링
+                if sku.resource_type != "virtualMachines":
+                    continue
 
-                    vcpus = 0
-                    memory_gb = 0.0
-                    family = sku.family or ""
+                vcpus = 0
+                memory_gb = 0.0
+                family = sku.family or ""
 
-                    for capability in (sku.capabilities or []):
-                        if capability.name == "vCPUs":
-                            vcpus = int(capability.value)
-                        elif capability.name == "MemoryGB":
-                            memory_gb = float(capability.value)
+                for capability in (sku.capabilities or []):
+                    if capability.name == "vCPUs":
+                        vcpus = int(capability.value)
+                    elif capability.name == "MemoryGB":
+                        memory_gb = float(capability.value)
 
-                    skus.append({
-                        "name": sku.name,
-                        "family": family,
-                        "vcpus": vcpus,
-                        "memory_gb": memory_gb,
-                    })
+                skus.append({
+                    "name": sku.name,
+                    "family": family,
+                    "vcpus": vcpus,
+                    "memory_gb": memory_gb,
+                })
 
-                # 이름순 정렬
-                skus.sort(key=lambda s: s["name"])
+            # 이름순 정렬
+            skus.sort(key=lambda s: s["name"])
 
-                cls._vm_skus_cache[location] = skus
-                cls._vm_skus_cache_time[location] = current_time
-                logger.info("Cached %d VM SKUs for %s", len(skus), location)
-                return skus
+            cls._vm_skus_cache[location] = skus
+            cls._vm_skus_cache_time[location] = current_time
+            logger.info("Cached %d VM SKUs for %s", len(skus), location)
+            return skus
 
         except Exception as e:
             logger.error("Failed to list VM SKUs for %s: %s", location, e)
@@ -728,70 +878,218 @@ class ResourceManagerService:
 
             return []
 
+    @staticmethod
+    def _resource_types_ttl() -> float:
+        """지터를 적용한 리소스 타입 캐시 TTL을 반환한다."""
+        return _RESOURCE_TYPES_CACHE_TTL * (
+            1 + random.uniform(-_RESOURCE_TYPES_TTL_JITTER, _RESOURCE_TYPES_TTL_JITTER)
+        )
+
+    @classmethod
+    def _resource_types_cache_servable(cls) -> bool:
+        """만료됐더라도 제공 가능한(stale 한도 이내) 캐시가 있는지 확인한다.
+
+        부분 갱신은 만료 시각만 늦추므로, 한도는 만료 시각이 아니라
+        캐시에 포함된 가장 오래된 데이터의 조회 시각으로 판단한다.
+        """
+        age = time.monotonic() - cls._resource_types_fetched_at
+        return bool(cls._resource_types_cache) and age < _RESOURCE_TYPES_STALE_LIMIT
+
+    @classmethod
+    def _resource_types_cache_fresh(cls) -> bool:
+        """전체 리소스 타입 캐시가 유효한지 확인한다."""
+        return bool(cls._resource_types_cache) and (
+            time.monotonic() < cls._resource_types_expires_at
+        )
+
     async def get_resource_types(
         self, namespaces: list[str] | None = None,
     ) -> list[dict[str, str]]:
         """Azure Resource Provider에서 사용 가능한 리소스 타입을 조회한다.
 
-        결과는 클래스 레벨에서 24시간 동안 캐시된다.
+        결과는 클래스 레벨에서 약 24시간(±10% 지터) 동안 캐시된다. 만료된 캐시가
+        있으면 즉시 반환하고 백그라운드에서 갱신한다(stale-while-revalidate).
+        갱신이 계속 실패하면 만료된 데이터는 조회 시점부터 TTL의 7배까지만 제공하며,
+        사용할 캐시가 없을 때만 갱신 완료를 기다린다.
 
         Args:
             namespaces: 조회할 프로바이더 네임스페이스 목록.
 
         Returns:
             value, label, category를 포함하는 리소스 타입 목록.
+            캐시된 목록을 그대로 반환하므로 호출자는 수정하지 않아야 한다.
         """
         cls = type(self)
-        current_time = time.time()
-        if cls._resource_types_cache and \
-           (current_time - cls._resource_types_cache_time) < _RESOURCE_TYPES_CACHE_TTL:
+        if cls._resource_types_cache_fresh():
             logger.debug("Returning cached resource types")
-            return list(cls._resource_types_cache.values())
+            return cls._resource_types_cache
 
         if namespaces is None:
             namespaces = settings.default_services
 
-        try:
-            logger.info("Fetching resource types from Azure for namespaces: %s", namespaces)
-            resource_client = self._get_resource_client()
-            resource_types: list[dict[str, str]] = []
-
-            for namespace in namespaces:
-                try:
-                    provider = await resource_client.providers.get(namespace)
-                    category = namespace.split('.')[-1] if '.' in namespace else namespace
-
-                    for rt in provider.resource_types:
-                        if '/' in rt.resource_type:
-                            continue
-
-                        full_type = f"{namespace}/{rt.resource_type}"
-                        label = rt.resource_type
-                        label = re.sub(r'([a-z])([A-Z])', r'\1 \2', label)
-                        label = label.title()
-
-                        resource_types.append({
-                            'value': full_type,
-                            'label': label,
-                            'category': category,
-                        })
-
-                except Exception as e:
-                    logger.warning("Failed to get provider %s: %s", namespace, e)
-                    continue
+        if cls._resource_types_cache_servable():
+            task = cls._resource_types_refresh_task
+            if task is None or task.done():
+                cls._resource_types_refresh_task = asyncio.create_task(
+                    self._refresh_resource_types(namespaces)
+                )
+            logger.debug("Returning stale resource types while refreshing")
+            return cls._resource_types_cache
 
-            cls._resource_types_cache = {rt['value']: rt for rt in resource_types}
-            cls._resource_types_cache_time = current_time
+        return await self._refresh_resource_types(namespaces)
 
-            logger.info("Cached %d resource types", len(resource_types))
-            return resource_types
+    async def _refresh_resource_types(
+        self, namespaces: list[str],
+    ) -> list[dict[str, str]]:
+        """리소스 타입 캐시를 갱신한다.
 
-        except Exception as e:
-            logger.error("Failed to get resource types: %s", e)
-            if cls._resource_types_cache:
-                logger.warning("Returning expired cache due to error")
-                return list(cls._resource_types_cache.values())
-            return []
+        lock으로 한 번만 수행하며(single-flight), 네임스페이스별로도 캐시하여
+        일부 프로바이더 조회가 실패해도 나머지는 다시 조회하지 않는다.
+        실패한 네임스페이스는 60초부터 연속 실패마다 두 배로 늘어나는 간격으로만
+        재조회하고, 그동안은 부분 결과를 캐시해 제공한다.
+
+        Args:
+            namespaces: 조회할 프로바이더 네임스페이스 목록.
+
+        Returns:
+            갱신된(또는 실패 시 기존) 리소스 타입 목록.
+        """
+        cls = type(self)
+        async with cls._resource_types_lock:
+            # 대기하는 동안 다른 요청이 캐시를 채웠으면 그대로 사용한다
+            if cls._resource_types_cache_fresh():
+                return cls._resource_types_cache
+            now = time.monotonic()
+
+            # 프로세스 재시작/스케일 아웃 시 Table Storage 캐시로 Azure 조회를 생략한다
+            cache_key = ",".join(sorted(namespaces))
+            try:
+                from app.services.storage import storage_service
+                table_types, table_saved_at = await storage_service.get_resource_types_cache(
+                    cache_key,
+                )
+                # 저장 시각은 wall-clock이므로 경과 시간만큼 남은 TTL을 계산한다
+                remaining = (
+                    _RESOURCE_TYPES_CACHE_TTL - (time.time() - table_saved_at)
+                    if table_saved_at is not None else 0
+                )
+                if table_types and remaining > 0:
+                    logger.info("Returning Table Storage resource types cache")
+                    cls._resource_types_cache = table_types
+                    cls._resource_types_expires_at = now + remaining
+                    cls._resource_types_fetched_at = now - (
+                        _RESOURCE_TYPES_CACHE_TTL - remaining
+                    )
+                    return table_types
+            except Exception as e:
+                logger.warning(
+                    "Table Storage resource types cache lookup failed (non-fatal): %s", e,
+                )
+
+            try:
+                logger.info("Fetching resource types from Azure for namespaces: %s", namespaces)
+                resource_client = self._get_resource_client()
+                failures = cls._provider_types_failures
+                stale = [
+                    namespace for namespace in namespaces
+                    if not (
+                        (cached := cls._provider_types_cache.get(namespace))
+                        and now < cached[2]
+                    )
+                    # 최근 실패한 네임스페이스는 재시도 시각 전까지 다시 조회하지 않는다
+                    and not (namespace in failures and now < failures[namespace][1])
+                ]
+                # 네임스페이스별 조회는 서로 독립적이므로 병렬로 요청한다
+                providers = await asyncio.gather(
+                    *(resource_client.providers.get(namespace) for namespace in stale),
+                    return_exceptions=True,
+                )
+
+                for namespace, provider in zip(stale, providers):
+                    if isinstance(provider, Exception):
+                        count = failures.get(namespace, (0, 0.0))[0] + 1
+                        delay = min(
+                            _RESOURCE_TYPES_RETRY_TTL * 2 ** (count - 1),
+                            _RESOURCE_TYPES_RETRY_TTL_MAX,
+                        )
+                        failures[namespace] = (count, now + delay)
+                        logger.warning(
+                            "Failed to get provider %s (retry in %ds): %s",
+                            namespace, delay, provider,
+                        )
+                        continue
+                    failures.pop(namespace, None)
+                    cls._provider_types_cache[namespace] = (
+                        _build_resource_types(namespace, provider),
+                        now,
+                        now + self._resource_types_ttl(),
+                    )
+
+                # 조회에 계속 실패해 stale 한도를 넘긴 네임스페이스는 합치지 않는다
+                resource_types: list[dict[str, str]] = []
+                fetched_at = now
+                for namespace in namespaces:
+                    cached = cls._provider_types_cache.get(namespace)
+                    if not cached:
+                        continue
+                    if now - cached[1] >= _RESOURCE_TYPES_STALE_LIMIT:
+                        del cls._provider_types_cache[namespace]
+                        continue
+                    resource_types.extend(cached[0])
+                    fetched_at = min(fetched_at, cached[1])
+
+                cls._resource_types_cache = resource_types
+                cls._resource_types_fetched_at = fetched_at
+                # 실패한 네임스페이스가 있으면 부분 결과를 가장 이른 재시도 시각까지만
+                # 캐시하고, 그때 해당 네임스페이스만 백그라운드로 재조회한다
+                retry_at = [
+                    failures[namespace][1] for namespace in namespaces
+                    if namespace in failures
+                ]
+                if retry_at:
+                    cls._resource_types_expires_at = min(retry_at)
+                else:
+                    cls._resource_types_expires_at = now + self._resource_types_ttl()
+                    try:
+                        from app.services.storage import storage_service
+                        await storage_service.set_resource_types_cache(cache_key, resource_types)
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to persist resource types cache (non-fatal): %s", e,
+                        )
+
+                logger.info("Cached %d resource types", len(resource_types))
+                return resource_types
+
+            except Exception as e:
+                logger.error("Failed to get resource types: %s", e)
+                if cls._resource_types_cache_servable():
+                    logger.warning("Returning expired cache due to error")
+                    return cls._resource_types_cache
+                return []
+
+
+def _build_resource_types(namespace: str, provider: Any) -> list[dict[str, str]]:
+    """프로바이더 응답을 value/label/category 형식의 리소스 타입 목록으로 변환한다."""
+    category = namespace.split('.')[-1] if '.' in namespace else namespace
+    resource_types: list[dict[str, str]] = []
+
+    for rt in provider.resource_types:
+        if '/' in rt.resource_type:
+            continue
+
+        # 대문자가 없으면(예: 'servers') 단어 경계가 없으므로 정규식을 생략한다
+        label = (
+            rt.resource_type if rt.resource_type.islower()
+            else _CAMEL_SPLIT_RE.sub(' ', rt.resource_type)
+        )
+        resource_types.append({
+            'value': f"{namespace}/{rt.resource_type}",
+            'label': label[:1].upper() + label[1:],
+            'category': category,
+        })
+
+    return resource_types
 
 
 @lru_cache(maxsize=1)
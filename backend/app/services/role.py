@@ -2,7 +2,9 @@
 
 허용된 사용자 목록과 역할을 Table Storage에서 관리한다.
 """
+import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 from typing import Any, Optional
 
@@ -11,6 +13,23 @@ from app.models import UserRole, UserStatus
 
 logger = logging.getLogger(__name__)
 
+# 인증 요청마다 Table Storage를 조회하지 않도록 역할을 잠시 캐시한다.
+# 역할 변경·사용자 삭제는 같은 프로세스에서 즉시 무효화된다.
+_USER_ROLE_CACHE_TTL = 60
+# 미등록 사용자도 짧게 캐시하여 반복 요청이 매번 저장소를 조회하지 않게 한다
+_USER_ROLE_NEGATIVE_CACHE_TTL = 10
+_USER_ROLE_CACHE_MAX_SIZE = 1024
+
+
+def _utcnow_iso() -> str:
+    """현재 UTC 시각을 ISO 8601 문자열로 반환한다."""
+    return datetime.now(UTC).isoformat()
+
+
+def _norm_email(email: str) -> str:
+    """이메일을 비교·RowKey용으로 정규화한다 (공백 제거 + 소문자)."""
+    return (email or "").strip().lower()
+
 
 class RoleService:
     """포털 사용자 역할을 관리하는 서비스.
@@ -19,10 +38,16 @@ class RoleService:
 
     Attributes:
         _storage: StorageService 인스턴스 (lazy-loaded).
+        _role_cache: 이메일 → (역할, 만료 시각) 캐시. 미등록 사용자는 역할이 None.
+        _role_inflight: 이메일 → 진행 중인 역할 조회.
     """
 
     def __init__(self) -> None:
         self._storage = None
+        self._role_cache: dict[str, tuple[Optional[str], float]] = {}
+        self._role_inflight: dict[str, asyncio.Future] = {}
+        # 조회 도중 무효화된 결과가 캐시에 다시 저장되지 않도록 한다
+        self._role_cache_generation = 0
 
     @property
     def storage(self):
@@ -48,39 +73,84 @@ class RoleService:
         Returns:
             사용자 역할 문자열 ("admin" 또는 "user"), 미등록 시 None.
         """
-        email = (user_info.get("email") or "").strip().lower()
+        email = _norm_email(user_info.get("email") or "")
         if not email:
             return None
 
-        stored_user = await self.storage.get_portal_user(email)
+        cached = self._role_cache.get(email)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        # 같은 사용자의 동시 요청은 하나의 조회를 함께 기다린다
+        task = self._role_inflight.get(email)
+        if task is None:
+            task = asyncio.ensure_future(self._load_role(email, user_info))
+            self._role_inflight[email] = task
+
+            def _clear(done: asyncio.Future) -> None:
+                if self._role_inflight.get(email) is done:
+                    del self._role_inflight[email]
+
+            task.add_done_callback(_clear)
+        return await asyncio.shield(task)
+
+    async def _load_role(
+        self, email: str, user_info: dict[str, Any]
+    ) -> Optional[str]:
+        """Table Storage에서 역할을 조회하고 결과를 캐시한다."""
+        generation = self._role_cache_generation
+        stored_user, etag = await self.storage.get_portal_user_with_etag(email)
         if not stored_user:
+            if generation == self._role_cache_generation:
+                self._cache_role(email, None, _USER_ROLE_NEGATIVE_CACHE_TTL)
             return None
 
         # 최초 로그인 시 JWT에서 가져온 이름·OID를 보충 저장
-        needs_update = False
+        changes: dict[str, Any] = {}
         if not stored_user.get("user_id") and user_info.get("user_id"):
-            stored_user["user_id"] = user_info["user_id"]
-            needs_update = True
+            changes["user_id"] = user_info["user_id"]
         if not stored_user.get("name") and user_info.get("name"):
-            stored_user["name"] = user_info["name"]
-            needs_update = True
+            changes["name"] = user_info["name"]
 
         # 미활성 사용자가 처음 로그인하면 active로 전환
         if stored_user.get("status") in (
             UserStatus.INVITED.value,
             UserStatus.PENDING.value,
         ):
-            stored_user["status"] = UserStatus.ACTIVE.value
-            needs_update = True
+            changes["status"] = UserStatus.ACTIVE.value
             logger.info("Activated user: %s", email)
 
-        if needs_update:
+        if changes:
             try:
-                await self.storage.save_portal_user(stored_user)
+                await self.storage.merge_portal_user(email, changes, etag=etag)
             except Exception as e:
                 logger.error("Failed to update user profile: %s", e)
 
-        return stored_user.get("role", UserRole.USER.value)
+        role = stored_user.get("role", UserRole.USER.value)
+        if generation == self._role_cache_generation:
+            self._cache_role(email, role, _USER_ROLE_CACHE_TTL)
+        return role
+
+    def _cache_role(self, email: str, role: Optional[str], ttl: float) -> None:
+        """조회한 역할을 TTL과 함께 캐시한다."""
+        now = time.monotonic()
+        if len(self._role_cache) >= _USER_ROLE_CACHE_MAX_SIZE:
+            # 만료 항목을 먼저 정리하고, 그래도 가득 차면 가장 오래된 항목 제거
+            for key in [k for k, (_, exp) in self._role_cache.items() if exp <= now]:
+                del self._role_cache[key]
+            if len(self._role_cache) >= _USER_ROLE_CACHE_MAX_SIZE:
+                del self._role_cache[next(iter(self._role_cache))]
+        self._role_cache[email] = (role, now + ttl)
+
+    def invalidate_user(self, email: str) -> None:
+        """사용자의 캐시된 역할을 무효화한다.
+
+        진행 중인 조회도 결과를 캐시하지 않고, 이후 요청은 새로 조회한다.
+        """
+        normalized = _norm_email(email)
+        self._role_cache.pop(normalized, None)
+        self._role_inflight.pop(normalized, None)
+        self._role_cache_generation += 1
 
     async def add_user(
         self, email: str, role: str = "user", name: str = ""
@@ -98,12 +168,13 @@ class RoleService:
         user_data = {
             "user_id": "",
             "name": name,
-            "email": email.strip().lower(),
+            "email": _norm_email(email),
             "role": role,
             "status": UserStatus.PENDING.value,
-            "registered_at": datetime.now(UTC).isoformat(),
+            "registered_at": _utcnow_iso(),
         }
         await self.storage.save_portal_user(user_data)
+        self.invalidate_user(email)
         logger.info("Added portal user: %s (role: %s)", email, role)
         return user_data
 
@@ -116,7 +187,7 @@ class RoleService:
         Raises:
             NotFoundError: 사용자를 찾을 수 없는 경우.
         """
-        normalized = email.strip().lower()
+        normalized = _norm_email(email)
         stored_user = await self.storage.get_portal_user(normalized)
         if not stored_user:
             raise NotFoundError(
@@ -124,6 +195,7 @@ class RoleService:
                 resource_type="PortalUser",
             )
         await self.storage.delete_portal_user(normalized)
+        self.invalidate_user(normalized)
         logger.info("Removed portal user: %s", email)
 
     async def get_all_users(self) -> list[dict[str, Any]]:
@@ -145,7 +217,7 @@ class RoleService:
         Raises:
             NotFoundError: 사용자를 찾을 수 없는 경우.
         """
-        normalized = email.strip().lower()
+        normalized = _norm_email(email)
         stored_user = await self.storage.get_portal_user(normalized)
         if not stored_user:
             raise NotFoundError(
@@ -155,6 +227,7 @@ class RoleService:
 
         stored_user["role"] = new_role
         await self.storage.save_portal_user(stored_user)
+        self.invalidate_user(normalized)
         logger.info("Updated role for user %s to %s", email, new_role)
         return stored_user
 
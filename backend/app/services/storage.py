@@ -7,27 +7,39 @@ Tables:
 - workshops: 워크샵 메타데이터 (PartitionKey="workshop", RowKey=workshop_id)
 - templates: ARM 템플릿 (PartitionKey="template", RowKey=template_name)
 """
+import asyncio
 import base64
 import gzip
-import json
 import logging
+import re
 import time
-from functools import lru_cache
-from typing import Any
-
-from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+import uuid
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+import orjson
+from azure.core.exceptions import (
+    HttpResponseError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
 from azure.core import MatchConditions
-from azure.data.tables.aio import TableServiceClient
+from azure.data.tables import UpdateMode
+from azure.data.tables.aio import TableClient, TableServiceClient
 from pydantic import ValidationError as PydanticValidationError
 
 from app.config import settings
 from app.exceptions import (
     ConflictError,
     EntityNotFoundError,
+    InvalidFormatError,
     ValidationError as AppValidationError,
 )
 from app.models import DeletionFailureItem, WorkshopMetadata
-from app.services.credential import get_async_azure_credential
+from app.services.credential import get_shared_async_azure_credential
+from app.services.transport import TunedAioHttpTransport
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +48,13 @@ TEMPLATES_TABLE = "templates"
 USERS_TABLE = "users"
 DELETION_FAILURES_TABLE = "deletionfailures"
 PORTAL_SETTINGS_TABLE = "portalsettings"
+_TABLE_NAMES = (
+    WORKSHOPS_TABLE,
+    TEMPLATES_TABLE,
+    USERS_TABLE,
+    DELETION_FAILURES_TABLE,
+    PORTAL_SETTINGS_TABLE,
+)
 
 WORKSHOP_PARTITION_KEY = "workshop"
 TEMPLATE_PARTITION_KEY = "template"
@@ -43,11 +62,90 @@ USER_PARTITION_KEY = "user"
 PORTAL_SETTINGS_PARTITION_KEY = "config"
 PORTAL_SETTINGS_ROW_KEY_SUBSCRIPTIONS = "subscriptions"
 VM_SKUS_PARTITION_KEY = "vmskus"
+RESOURCE_TYPES_PARTITION_KEY = "resourcetypes"
+
+# 고정 파티션 목록 조회 필터
+_WORKSHOP_LIST_FILTER = f"PartitionKey eq '{WORKSHOP_PARTITION_KEY}'"
+_USER_LIST_FILTER = f"PartitionKey eq '{USER_PARTITION_KEY}'"
+_TEMPLATE_LIST_FILTER = f"PartitionKey eq '{TEMPLATE_PARTITION_KEY}'"
 
 _VM_SKUS_TABLE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7일
 
 _ACQUIRE_MAX_RETRIES = 3
 
+# PartitionKey/RowKey에 허용되지 않는 문자 (/, \, #, ?, 제어 문자)와 최대 길이
+_INVALID_KEY_CHARS_RE = re.compile(r"[/\\#?\x00-\x1f\x7f-\x9f]")
+_MAX_KEY_BYTES = 1024
+
+# 삭제 실패 RowKey = (최대값 - failed_at 밀리초) + "_" + uuid.
+# Table Storage는 RowKey 오름차순으로 반환하므로 최신 항목이 먼저 온다.
+_MAX_TICKS = 10**19 - 1
+_INVERTED_KEY_RE = re.compile(r"\d{19}_")
+
+# 목록 화면용 워크샵 컬럼 (gzip 스냅샷 컬럼 제외)
+_WORKSHOP_SUMMARY_FIELDS = [
+    "RowKey",
+    "name",
+    "start_date",
+    "end_date",
+    "base_resources_template",
+    "deployment_region",
+    "status",
+    "created_at",
+    "created_by",
+    "description",
+    "survey_url",
+    "participants_json_gz",
+    "planned_participants_json_gz",
+    # 재저장되지 않은 구버전 행은 비압축 컬럼에만 참가자가 있으므로
+    # 모든 행이 _gz 컬럼으로 다시 쓰일 때까지 함께 조회한다
+    "participants_json",
+    "planned_participants_json",
+    "policy_json",
+]
+
+# 사용자 목록 조회 컬럼 (_entity_to_user가 읽는 필드만)
+_USER_FIELDS = ["RowKey", "user_id", "name", "role", "status", "registered_at"]
+
+# Table Storage 쿼리 페이지 최대 크기. 연속 토큰 기반이라 페이지를 병렬로
+# 가져올 수 없으므로 페이지당 엔티티 수를 늘려 왕복 횟수를 줄인다.
+_QUERY_PAGE_SIZE = 1000
+
+# entity group transaction 한 번에 담을 수 있는 최대 작업 수
+_MAX_TRANSACTION_OPERATIONS = 100
+
+# datetime은 기존 json.dumps(default=str)와 같은 형식으로 저장되도록 default로 넘긴다
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+_WORKSHOP_LIST_CACHE_KEY = "workshops"
+_WORKSHOP_SUMMARY_LIST_CACHE_KEY = "workshop_summaries"
+_TEMPLATE_LIST_CACHE_KEY = "templates"
+
+_T = TypeVar("_T")
+
+
+def _requires_tables(
+    method: Callable[..., Awaitable[_T]],
+) -> Callable[..., Awaitable[_T]]:
+    """테이블 초기화가 끝난 뒤 메서드를 실행하도록 감싼다.
+
+    초기화가 끝난 뒤에는 플래그만 확인하고 원래 코루틴을 그대로 반환하므로
+    호출마다 _ensure_tables_exist() 코루틴을 만들지 않는다.
+    """
+
+    @wraps(method)
+    def wrapper(self: "StorageService", *args: Any, **kwargs: Any) -> Awaitable[_T]:
+        if StorageService._tables_initialized:
+            return method(self, *args, **kwargs)
+
+        async def _init_then_call() -> _T:
+            await self._ensure_tables_exist()
+            return await method(self, *args, **kwargs)
+
+        return _init_then_call()
+
+    return wrapper
+
 
 class StorageService:
     """Azure Table Storage를 사용하여 워크샵 데이터를 관리하는 비동기 서비스.
@@ -57,6 +155,7 @@ class StorageService:
     """
 
     _tables_initialized: bool = False
+    _tables_init_task: "asyncio.Task[None] | None" = None
 
     def __init__(self) -> None:
         """Azure Identity를 사용하여 비동기 Table Storage 클라이언트를 초기화한다."""
@@ -64,42 +163,140 @@ class StorageService:
             account_url = (
                 f"https://{settings.table_storage_account}.table.core.windows.net"
             )
-            credential = get_async_azure_credential()
+            credential = get_shared_async_azure_credential()
 
             self.table_service_client = TableServiceClient(
                 endpoint=account_url,
                 credential=credential,
                 retry_total=settings.azure_retry_total,
                 retry_backoff_factor=settings.azure_retry_backoff_factor,
+                retry_backoff_max=settings.azure_retry_backoff_max,
+                transport=TunedAioHttpTransport(),
             )
 
+            # 목록 캐시: key -> (만료 시각, 목록). 세대 번호는 조회 도중 무효화된
+            # 결과가 캐시에 다시 저장되지 않도록 한다.
+            self._list_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+            self._list_cache_generation: dict[str, int] = {}
+            # 진행 중인 조회: key -> Future (_coalesced 참고)
+            self._inflight: dict[str, asyncio.Future] = {}
+            self._table_clients: dict[str, TableClient] = {}
+            # 배포용 템플릿 캐시: name -> (만료 시각, 파싱된 템플릿).
+            # 참가자별 배포가 동시에 같은 템플릿을 요청하므로 템플릿별로 조회를 합친다.
+            self._template_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+            self._template_detail_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+            self._template_cache_generation = 0
+
             logger.info("Initialized async Table Storage service")
         except Exception as e:
             logger.error("Failed to initialize Table Storage client: %s", e)
             raise
 
     async def _ensure_tables_exist(self) -> None:
-        """필요한 테이블이 존재하지 않으면 생성한다 (lazy 초기화)."""
+        """필요한 테이블이 존재하지 않으면 생성한다 (lazy 초기화).
+
+        settings.ensure_storage_tables가 False면 테이블이 이미 존재한다고 보고
+        생성 확인 요청을 보내지 않는다. 초기화 도중 들어온 호출은 진행 중인
+        작업을 함께 기다리므로 생성 확인 요청은 프로세스당 한 번만 전송된다.
+        """
         if StorageService._tables_initialized:
             return
-        for table_name in (
-            WORKSHOPS_TABLE,
-            TEMPLATES_TABLE,
-            USERS_TABLE,
-            DELETION_FAILURES_TABLE,
-            PORTAL_SETTINGS_TABLE,
-        ):
+        if not settings.ensure_storage_tables:
+            StorageService._tables_initialized = True
+            return
+
+        task = StorageService._tables_init_task
+        if task is None:
+            task = asyncio.ensure_future(self._create_tables())
+            StorageService._tables_init_task = task
+        await asyncio.shield(task)
+
+    async def _create_tables(self) -> None:
+        """필요한 테이블을 병렬로 생성 확인한다."""
+
+        async def _ensure(table_name: str) -> None:
             try:
                 await self.table_service_client.create_table_if_not_exists(table_name)
-                logger.info("Ensured table exists: %s", table_name)
+                logger.debug("Ensured table exists: %s", table_name)
             except Exception as e:
                 logger.warning("Table check failed for '%s': %s", table_name, e)
+
+        await asyncio.gather(*(_ensure(table_name) for table_name in _TABLE_NAMES))
         StorageService._tables_initialized = True
 
+    async def warmup(self) -> None:
+        """테이블 존재 확인과 토큰·커넥션 준비를 앱 시작 시점에 미리 수행한다.
+
+        첫 요청이 테이블 생성 확인과 TLS 핸드셰이크 비용을 부담하지 않도록
+        lifespan startup에서 호출한다.
+        """
+        await self._ensure_tables_exist()
+
+    async def close(self) -> None:
+        """Table Storage 클라이언트와 HTTP 세션을 닫는다."""
+        await self.table_service_client.close()
+
+    def _table(self, table_name: str) -> TableClient:
+        """테이블별 TableClient를 캐시하여 반환한다.
+
+        TableClient는 서비스 클라이언트의 파이프라인을 공유하므로
+        요청마다 새로 만들 필요가 없다.
+        """
+        client = self._table_clients.get(table_name)
+        if client is None:
+            client = self.table_service_client.get_table_client(table_name)
+            self._table_clients[table_name] = client
+        return client
+
+    def _get_cached_list(self, key: str) -> list[dict[str, Any]] | None:
+        """만료되지 않은 목록 캐시의 복사본을 반환한다."""
+        cached = self._list_cache.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        return list(cached[1])
+
+    def _set_cached_list(
+        self, key: str, generation: int, items: list[dict[str, Any]], ttl: int,
+    ) -> None:
+        """조회 시작 이후 무효화되지 않았으면 목록을 캐시한다."""
+        if ttl > 0 and self._list_cache_generation.get(key, 0) == generation:
+            self._list_cache[key] = (time.monotonic() + ttl, list(items))
+
+    async def _coalesced(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """같은 key의 조회가 진행 중이면 새로 조회하지 않고 그 결과를 기다린다.
+
+        캐시가 만료된 직후 요청이 몰려도 Table Storage 조회는 key별로 한 번만
+        실행되며, 서로 다른 key의 조회는 서로를 기다리지 않는다.
+        한 호출자가 취소되어도 공유 조회는 취소되지 않는다.
+        결과 객체는 호출자 간에 공유된다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _clear(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_clear)
+        return await asyncio.shield(task)
+
+    def _invalidate_list_cache(self, *keys: str) -> None:
+        """목록 캐시를 무효화한다."""
+        for key in keys:
+            self._list_cache.pop(key, None)
+            self._list_cache_generation[key] = self._list_cache_generation.get(key, 0) + 1
+
     # ------------------------------------------------------------------
     # Workshop metadata
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def save_workshop_metadata(self, workshop_id: str, metadata: dict[str, Any]) -> bool:
         """워크샵 메타데이터를 테이블 엔티티로 저장한다.
 
@@ -114,16 +311,20 @@ class StorageService:
             성공 시 True.
 
         Raises:
-            AppValidationError: 메타데이터가 스키마 검증에 실패한 경우.
+            AppValidationError: 메타데이터가 스키마 검증에 실패하거나
+                workshop_id를 키로 쓸 수 없는 경우.
         """
+        _validate_key(workshop_id, "workshop_id")
         self._validate_workshop_metadata(metadata)
-        await self._ensure_tables_exist()
 
         try:
-            table_client = self.table_service_client.get_table_client(WORKSHOPS_TABLE)
+            table_client = self._table(WORKSHOPS_TABLE)
             entity = _workshop_to_entity(workshop_id, metadata)
             await table_client.upsert_entity(entity)
-            logger.info("Saved workshop metadata: %s", workshop_id)
+            self._invalidate_list_cache(
+                _WORKSHOP_LIST_CACHE_KEY, _WORKSHOP_SUMMARY_LIST_CACHE_KEY
+            )
+            logger.debug("Saved workshop metadata: %s", workshop_id)
             return True
         except Exception as e:
             logger.error("Failed to save workshop metadata: %s", e)
@@ -149,6 +350,7 @@ class StorageService:
                 f"Workshop metadata validation failed: {'; '.join(error_details)}"
             ) from e
 
+    @_requires_tables
     async def get_workshop_metadata(self, workshop_id: str) -> dict[str, Any] | None:
         """워크샵 메타데이터를 조회한다.
 
@@ -159,10 +361,8 @@ class StorageService:
             워크샵 메타데이터 딕셔너리. 존재하지 않으면 None.
         """
 
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(WORKSHOPS_TABLE)
+            table_client = self._table(WORKSHOPS_TABLE)
             entity = await table_client.get_entity(
                 partition_key=WORKSHOP_PARTITION_KEY,
                 row_key=workshop_id,
@@ -175,28 +375,85 @@ class StorageService:
             logger.error("Failed to retrieve workshop metadata: %s", e)
             raise
 
-    async def list_all_workshops(self) -> list[dict[str, Any]]:
+    async def list_all_workshops(
+        self, use_cache: bool = True, include_snapshots: bool = True,
+    ) -> list[dict[str, Any]]:
         """모든 워크샵 메타데이터를 조회한다.
 
+        결과는 settings.workshop_list_cache_ttl_seconds 동안 캐시되며,
+        워크샵 저장/삭제 시 무효화된다.
+
+        Args:
+            use_cache: False면 캐시를 건너뛰고 항상 Table Storage를 조회한다.
+                상태 전이를 판단하는 백그라운드 작업에서 사용한다.
+            include_snapshots: False면 cost/resource 스냅샷 컬럼을 서버에서
+                제외하고 조회한다(값은 None). 결과를 다시 저장하는 경로에서는
+                스냅샷이 지워지므로 사용하지 않는다.
+
         Returns:
             created_at 내림차순으로 정렬된 워크샵 메타데이터 목록.
         """
-
-        await self._ensure_tables_exist()
-
+        cache_key = (
+            _WORKSHOP_LIST_CACHE_KEY if include_snapshots
+            else _WORKSHOP_SUMMARY_LIST_CACHE_KEY
+        )
+        if not use_cache:
+            return await self._query_workshops(cache_key, include_snapshots)
+
+        cached = self._get_cached_list(cache_key)
+        if cached is not None:
+            return cached
+        return list(await self._coalesced(
+            cache_key, lambda: self._query_workshops(cache_key, include_snapshots)
+        ))
+
+    @_requires_tables
+    async def _query_workshops(
+        self, cache_key: str, include_snapshots: bool,
+    ) -> list[dict[str, Any]]:
+        """워크샵 목록을 Table Storage에서 조회하고 캐시에 저장한다."""
+        generation = self._list_cache_generation.get(cache_key, 0)
         try:
-            table_client = self.table_service_client.get_table_client(WORKSHOPS_TABLE)
-            query_filter = f"PartitionKey eq '{WORKSHOP_PARTITION_KEY}'"
             workshops = [
-                _entity_to_workshop(e)
-                async for e in table_client.query_entities(query_filter)
+                w async for w in self.aiter_workshops(include_snapshots)
             ]
             workshops.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+            self._set_cached_list(
+                cache_key, generation, workshops,
+                settings.workshop_list_cache_ttl_seconds,
+            )
             return workshops
         except Exception as e:
             logger.error("Failed to list workshops: %s", e)
             raise
 
+    async def aiter_workshops(
+        self, include_snapshots: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """워크샵 메타데이터를 페이지 단위로 받아 하나씩 반환한다.
+
+        정렬·캐시 없이 Table Storage 반환 순서(RowKey 순)대로 내보내므로
+        전체 목록을 한 번에 메모리에 올리지 않는다. 상태별로 걸러 내기만
+        하는 백그라운드 작업에서 사용한다.
+
+        Args:
+            include_snapshots: False면 cost/resource 스냅샷 컬럼을 제외한다.
+
+        Yields:
+            워크샵 메타데이터 딕셔너리.
+        """
+        # async generator는 _requires_tables로 감쌀 수 없어 직접 초기화를 기다린다
+        await self._ensure_tables_exist()
+
+        table_client = self._table(WORKSHOPS_TABLE)
+        async for entity in table_client.query_entities(
+            _WORKSHOP_LIST_FILTER,
+            select=None if include_snapshots else _WORKSHOP_SUMMARY_FIELDS,
+            results_per_page=_QUERY_PAGE_SIZE,
+        ):
+            yield _entity_to_workshop(entity)
+
+    @_requires_tables
     async def delete_workshop_metadata(self, workshop_id: str) -> bool:
         """워크샵 메타데이터를 삭제한다.
 
@@ -207,18 +464,17 @@ class StorageService:
             성공 시 True.
         """
 
-        await self._ensure_tables_exist()
-
         try:
-            workshops_client = self.table_service_client.get_table_client(
-                WORKSHOPS_TABLE
-            )
+            workshops_client = self._table(WORKSHOPS_TABLE)
             await workshops_client.delete_entity(
                 partition_key=WORKSHOP_PARTITION_KEY,
                 row_key=workshop_id,
             )
+            self._invalidate_list_cache(
+                _WORKSHOP_LIST_CACHE_KEY, _WORKSHOP_SUMMARY_LIST_CACHE_KEY
+            )
 
-            logger.info("Deleted workshop: %s", workshop_id)
+            logger.debug("Deleted workshop: %s", workshop_id)
             return True
         except Exception as e:
             logger.error("Failed to delete workshop: %s", e)
@@ -228,6 +484,7 @@ class StorageService:
     # Portal Users (role management)
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def save_portal_user(self, user_data: dict[str, Any]) -> bool:
         """포털 사용자 정보를 저장 또는 업데이트한다.
 
@@ -239,10 +496,8 @@ class StorageService:
         Returns:
             성공 시 True.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(USERS_TABLE)
+            table_client = self._table(USERS_TABLE)
             email = user_data.get("email", "").strip().lower()
             entity = {
                 "PartitionKey": USER_PARTITION_KEY,
@@ -254,7 +509,7 @@ class StorageService:
                 "registered_at": user_data.get("registered_at", ""),
             }
             await table_client.upsert_entity(entity)
-            logger.info("Saved portal user: %s", email)
+            logger.debug("Saved portal user: %s", email)
             return True
         except Exception as e:
             logger.error("Failed to save portal user: %s", e)
@@ -269,28 +524,82 @@ class StorageService:
         Returns:
             사용자 정보 딕셔너리. 존재하지 않으면 None.
         """
-        await self._ensure_tables_exist()
+        user, _ = await self.get_portal_user_with_etag(email)
+        return user
+
+    @_requires_tables
+    async def get_portal_user_with_etag(
+        self, email: str,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """포털 사용자 정보와 엔티티 etag를 함께 조회한다.
+
+        etag는 사용자 dict에 넣지 않고 따로 반환하므로, 조회한 사용자를
+        그대로 저장하거나 응답으로 내보내도 etag가 섞이지 않는다.
+
+        Args:
+            email: 사용자 이메일.
 
+        Returns:
+            (사용자 정보 딕셔너리, etag) 튜플. 존재하지 않으면 (None, None).
+        """
         try:
-            table_client = self.table_service_client.get_table_client(USERS_TABLE)
+            table_client = self._table(USERS_TABLE)
             entity = await table_client.get_entity(
                 partition_key=USER_PARTITION_KEY,
                 row_key=email.strip().lower(),
             )
-            return {
-                "user_id": entity.get("user_id", ""),
-                "name": entity.get("name", ""),
-                "email": entity["RowKey"],
-                "role": entity.get("role", "user"),
-                "status": entity.get("status", "active"),
-                "registered_at": entity.get("registered_at", ""),
-            }
+            return _entity_to_user(entity), entity.metadata.get("etag")
         except ResourceNotFoundError:
-            return None
+            return None, None
         except Exception as e:
             logger.error("Failed to get portal user: %s", e)
             raise
 
+    @_requires_tables
+    async def merge_portal_user(
+        self,
+        email: str,
+        partial: dict[str, Any],
+        etag: str | None = None,
+    ) -> bool:
+        """포털 사용자의 일부 필드만 MERGE로 갱신한다.
+
+        전체 엔티티를 다시 쓰지 않으므로 동시에 다른 필드를 변경한 요청의
+        결과를 덮어쓰지 않는다. etag가 주어지면 조회 이후 변경되지 않은
+        경우에만 갱신한다.
+
+        Args:
+            email: 사용자 이메일.
+            partial: 갱신할 필드 (user_id, name, role, status 등).
+            etag: get_portal_user_with_etag()가 반환한 etag. None이면 조건 없이 갱신.
+
+        Returns:
+            성공 시 True.
+        """
+        try:
+            table_client = self._table(USERS_TABLE)
+            entity = {
+                "PartitionKey": USER_PARTITION_KEY,
+                "RowKey": email.strip().lower(),
+                **partial,
+            }
+            if etag:
+                await table_client.update_entity(
+                    entity,
+                    mode=UpdateMode.MERGE,
+                    etag=etag,
+                    match_condition=MatchConditions.IfNotModified,
+                )
+            else:
+                await table_client.update_entity(entity, mode=UpdateMode.MERGE)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Merged portal user fields: %s (%s)", email, ", ".join(partial))
+            return True
+        except Exception as e:
+            logger.error("Failed to merge portal user: %s", e)
+            raise
+
+    @_requires_tables
     async def delete_portal_user(self, email: str) -> bool:
         """포털 사용자를 삭제한다.
 
@@ -300,10 +609,8 @@ class StorageService:
         Returns:
             성공 시 True.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(USERS_TABLE)
+            table_client = self._table(USERS_TABLE)
             await table_client.delete_entity(
                 partition_key=USER_PARTITION_KEY,
                 row_key=email.strip().lower(),
@@ -314,31 +621,24 @@ class StorageService:
             logger.error("Failed to delete portal user: %s", e)
             raise
 
+    @_requires_tables
     async def list_portal_users(self) -> list[dict[str, Any]]:
         """모든 포털 사용자를 조회한다.
 
         Returns:
             등록일 내림차순으로 정렬된 사용자 목록.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(USERS_TABLE)
-            query_filter = f"PartitionKey eq '{USER_PARTITION_KEY}'"
+            table_client = self._table(USERS_TABLE)
             users = [
-                {
-                    "user_id": e.get("user_id", ""),
-                    "name": e.get("name", ""),
-                    "email": e["RowKey"],
-                    "role": e.get("role", "user"),
-                    "status": e.get("status", "active"),
-                    "registered_at": e.get("registered_at", ""),
-                }
-                async for e in table_client.query_entities(query_filter)
+                _entity_to_user(e)
+                async for e in table_client.query_entities(
+                    _USER_LIST_FILTER,
+                    select=_USER_FIELDS,
+                    results_per_page=_QUERY_PAGE_SIZE,
+                )
             ]
-            users.sort(
-                key=lambda x: x.get("registered_at", ""), reverse=True
-            )
+            users.sort(key=itemgetter("registered_at"), reverse=True)
             return users
         except Exception as e:
             logger.error("Failed to list portal users: %s", e)
@@ -348,27 +648,27 @@ class StorageService:
     # Portal settings (subscription in-use tracking)
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def get_in_use_map(self) -> dict[str, str]:
         """현재 사용 중인 구독 매핑을 조회한다.
 
         Returns:
             구독 ID → 워크샵 ID 매핑. 설정이 없으면 빈 딕셔너리.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+            table_client = self._table(PORTAL_SETTINGS_TABLE)
             entity = await table_client.get_entity(
                 partition_key=PORTAL_SETTINGS_PARTITION_KEY,
                 row_key=PORTAL_SETTINGS_ROW_KEY_SUBSCRIPTIONS,
             )
-            return json.loads(entity.get("in_use_map_json", "{}"))
+            return orjson.loads(entity.get("in_use_map_json", "{}"))
         except ResourceNotFoundError:
             return {}
         except Exception as e:
             logger.error("Failed to get in_use_map: %s", e)
             raise
 
+    @_requires_tables
     async def acquire_subscriptions(
         self, subscription_ids: list[str], workshop_id: str,
     ) -> None:
@@ -384,8 +684,7 @@ class StorageService:
         Raises:
             ConflictError: 재시도 한도 초과 시.
         """
-        await self._ensure_tables_exist()
-        table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+        table_client = self._table(PORTAL_SETTINGS_TABLE)
 
         for attempt in range(_ACQUIRE_MAX_RETRIES):
             try:
@@ -408,7 +707,7 @@ class StorageService:
                     )
                     etag = entity.metadata["etag"]
 
-                in_use_map: dict[str, str] = json.loads(
+                in_use_map: dict[str, str] = orjson.loads(
                     entity.get("in_use_map_json", "{}")
                 )
 
@@ -425,7 +724,7 @@ class StorageService:
                 for sid in subscription_ids:
                     in_use_map[sid] = workshop_id
 
-                entity["in_use_map_json"] = json.dumps(in_use_map)
+                entity["in_use_map_json"] = _dumps_json(in_use_map)
                 await table_client.update_entity(
                     entity,
                     mode="replace",
@@ -449,6 +748,7 @@ class StorageService:
                     "Failed to acquire subscriptions due to concurrent modification"
                 ) from e
 
+    @_requires_tables
     async def release_subscriptions(self, subscription_ids: list[str]) -> None:
         """워크샵에서 사용 중인 구독을 해제한다 (ETag optimistic concurrency).
 
@@ -460,8 +760,7 @@ class StorageService:
         if not subscription_ids:
             return
 
-        await self._ensure_tables_exist()
-        table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+        table_client = self._table(PORTAL_SETTINGS_TABLE)
 
         for attempt in range(_ACQUIRE_MAX_RETRIES):
             try:
@@ -474,14 +773,14 @@ class StorageService:
                 except ResourceNotFoundError:
                     return  # Nothing to release
 
-                in_use_map: dict[str, str] = json.loads(
+                in_use_map: dict[str, str] = orjson.loads(
                     entity.get("in_use_map_json", "{}")
                 )
 
                 for sid in subscription_ids:
                     in_use_map.pop(sid, None)
 
-                entity["in_use_map_json"] = json.dumps(in_use_map)
+                entity["in_use_map_json"] = _dumps_json(in_use_map)
                 await table_client.update_entity(
                     entity,
                     mode="replace",
@@ -504,6 +803,7 @@ class StorageService:
                     "Failed to release subscriptions due to concurrent modification"
                 ) from e
 
+    @_requires_tables
     async def release_subscriptions_by_workshop(
         self, workshop_id: str,
     ) -> list[str]:
@@ -524,8 +824,7 @@ class StorageService:
         if not workshop_id:
             return []
 
-        await self._ensure_tables_exist()
-        table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+        table_client = self._table(PORTAL_SETTINGS_TABLE)
 
         for attempt in range(_ACQUIRE_MAX_RETRIES):
             try:
@@ -538,7 +837,7 @@ class StorageService:
                 except ResourceNotFoundError:
                     return []
 
-                in_use_map: dict[str, str] = json.loads(
+                in_use_map: dict[str, str] = orjson.loads(
                     entity.get("in_use_map_json", "{}")
                 )
 
@@ -551,7 +850,7 @@ class StorageService:
                 for sid in to_release:
                     del in_use_map[sid]
 
-                entity["in_use_map_json"] = json.dumps(in_use_map)
+                entity["in_use_map_json"] = _dumps_json(in_use_map)
                 await table_client.update_entity(
                     entity,
                     mode="replace",
@@ -583,6 +882,7 @@ class StorageService:
     # VM SKU cache
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def get_vm_sku_cache(
         self, cache_key: str,
     ) -> tuple[list[dict] | None, float | None]:
@@ -597,9 +897,8 @@ class StorageService:
             (SKU 목록, 저장 시각 unix timestamp) 튜플.
             데이터가 없으면 (None, None).
         """
-        await self._ensure_tables_exist()
         try:
-            table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+            table_client = self._table(PORTAL_SETTINGS_TABLE)
             entity = await table_client.get_entity(
                 partition_key=VM_SKUS_PARTITION_KEY,
                 row_key=cache_key,
@@ -607,10 +906,10 @@ class StorageService:
             if "skus_json_gz" in entity:
                 # gzip 압축 데이터 (base64 encoded)
                 compressed = base64.b64decode(entity["skus_json_gz"])
-                skus = json.loads(gzip.decompress(compressed).decode())
+                skus = orjson.loads(gzip.decompress(compressed))
             else:
                 # 구버전 비압축 폴백
-                skus = json.loads(entity.get("skus_json", "[]"))
+                skus = orjson.loads(entity.get("skus_json", "[]"))
             saved_at = float(entity.get("saved_at", 0))
             return skus, saved_at
         except ResourceNotFoundError:
@@ -619,6 +918,7 @@ class StorageService:
             logger.error("Failed to get VM SKU cache (key: %s): %s", cache_key, e)
             return None, None
 
+    @_requires_tables
     async def set_vm_sku_cache(self, cache_key: str, skus: list[dict]) -> None:
         """VM SKU 목록을 gzip 압축 후 Table Storage에 저장한다.
 
@@ -629,12 +929,11 @@ class StorageService:
             cache_key: 리전 조합 키 (정렬된 리전명 쉼표 구분).
             skus: 저장할 VM SKU 목록.
         """
-        await self._ensure_tables_exist()
         try:
             compressed = base64.b64encode(
-                gzip.compress(json.dumps(skus).encode())
+                gzip.compress(orjson.dumps(skus, option=_ORJSON_OPTIONS))
             ).decode()
-            table_client = self.table_service_client.get_table_client(PORTAL_SETTINGS_TABLE)
+            table_client = self._table(PORTAL_SETTINGS_TABLE)
             entity = {
                 "PartitionKey": VM_SKUS_PARTITION_KEY,
                 "RowKey": cache_key,
@@ -649,10 +948,69 @@ class StorageService:
         except Exception as e:
             logger.error("Failed to save VM SKU cache (key: %s): %s", cache_key, e)
 
+    # ------------------------------------------------------------------
+    # Resource type cache
+    # ------------------------------------------------------------------
+
+    @_requires_tables
+    async def get_resource_types_cache(
+        self, cache_key: str,
+    ) -> tuple[list[dict] | None, float | None]:
+        """Table Storage에서 리소스 타입 캐시 데이터를 조회한다.
+
+        Args:
+            cache_key: 네임스페이스 조합 키 (정렬된 네임스페이스 쉼표 구분).
+
+        Returns:
+            (리소스 타입 목록, 저장 시각 unix timestamp) 튜플.
+            데이터가 없으면 (None, None).
+        """
+        try:
+            table_client = self._table(PORTAL_SETTINGS_TABLE)
+            entity = await table_client.get_entity(
+                partition_key=RESOURCE_TYPES_PARTITION_KEY,
+                row_key=cache_key,
+            )
+            resource_types = _decompress_json(entity.get("resource_types_json_gz"))
+            if resource_types is None:
+                return None, None
+            return resource_types, float(entity.get("saved_at", 0))
+        except ResourceNotFoundError:
+            return None, None
+        except Exception as e:
+            logger.error("Failed to get resource types cache (key: %s): %s", cache_key, e)
+            return None, None
+
+    @_requires_tables
+    async def set_resource_types_cache(
+        self, cache_key: str, resource_types: list[dict],
+    ) -> None:
+        """리소스 타입 목록을 gzip 압축 후 Table Storage에 저장한다.
+
+        Args:
+            cache_key: 네임스페이스 조합 키 (정렬된 네임스페이스 쉼표 구분).
+            resource_types: 저장할 리소스 타입 목록.
+        """
+        try:
+            table_client = self._table(PORTAL_SETTINGS_TABLE)
+            await table_client.upsert_entity({
+                "PartitionKey": RESOURCE_TYPES_PARTITION_KEY,
+                "RowKey": cache_key,
+                "resource_types_json_gz": _compress_json(resource_types),
+                "saved_at": str(time.time()),
+            })
+            logger.info(
+                "Saved resource types cache to Table Storage (key: %s, count: %d)",
+                cache_key, len(resource_types),
+            )
+        except Exception as e:
+            logger.error("Failed to save resource types cache (key: %s): %s", cache_key, e)
+
     # ------------------------------------------------------------------
     # Templates
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def create_template(
         self,
         name: str,
@@ -674,21 +1032,12 @@ class StorageService:
             생성된 템플릿 정보 딕셔너리.
 
         Raises:
+            InvalidFormatError: 이름에 키로 쓸 수 없는 문자가 포함된 경우.
             ConflictError: 동일 이름의 템플릿이 이미 존재하는 경우.
         """
-        await self._ensure_tables_exist()
+        _validate_key(name, "name")
 
-        table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
-
-        # Check for duplicate name
-        try:
-            await table_client.get_entity(
-                partition_key=TEMPLATE_PARTITION_KEY,
-                row_key=name,
-            )
-            raise ConflictError(f"Template '{name}' already exists")
-        except ResourceNotFoundError:
-            pass  # Expected – template does not exist yet
+        table_client = self._table(TEMPLATES_TABLE)
 
         entity = {
             "PartitionKey": TEMPLATE_PARTITION_KEY,
@@ -701,7 +1050,12 @@ class StorageService:
         if compiled_arm_content:
             entity["compiled_arm_content"] = compiled_arm_content
 
-        await table_client.create_entity(entity)
+        try:
+            # 동일 이름이 있으면 서비스가 409로 거부하므로 사전 조회가 필요 없다
+            await table_client.create_entity(entity)
+        except ResourceExistsError:
+            raise ConflictError(f"Template '{name}' already exists")
+        self._invalidate_list_cache(_TEMPLATE_LIST_CACHE_KEY)
         logger.info("Created template: %s (type=%s)", name, template_type)
 
         return {
@@ -714,15 +1068,25 @@ class StorageService:
     async def list_templates(self) -> list[dict[str, str]]:
         """사용 가능한 인프라 템플릿 목록을 조회한다.
 
+        결과는 settings.template_list_cache_ttl_seconds 동안 캐시되며,
+        템플릿 생성/수정/삭제 시 무효화된다.
+
         Returns:
             템플릿 정보 딕셔너리 목록.
         """
+        cached = self._get_cached_list(_TEMPLATE_LIST_CACHE_KEY)
+        if cached is not None:
+            return cached
+        return list(
+            await self._coalesced(_TEMPLATE_LIST_CACHE_KEY, self._query_templates)
+        )
 
-        await self._ensure_tables_exist()
-
+    @_requires_tables
+    async def _query_templates(self) -> list[dict[str, str]]:
+        """템플릿 목록을 Table Storage에서 조회하고 캐시에 저장한다."""
+        generation = self._list_cache_generation.get(_TEMPLATE_LIST_CACHE_KEY, 0)
         try:
-            table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
-            query_filter = f"PartitionKey eq '{TEMPLATE_PARTITION_KEY}'"
+            table_client = self._table(TEMPLATES_TABLE)
             templates = [
                 {
                     "name": e["RowKey"],
@@ -730,9 +1094,16 @@ class StorageService:
                     "path": e.get("path", e["RowKey"]),
                     "template_type": e.get("template_type", "arm"),
                 }
-                async for e in table_client.query_entities(query_filter)
+                async for e in table_client.query_entities(
+                    _TEMPLATE_LIST_FILTER, results_per_page=_QUERY_PAGE_SIZE
+                )
             ]
-            return sorted(templates, key=lambda x: x["name"])
+            templates.sort(key=itemgetter("name"))
+            self._set_cached_list(
+                _TEMPLATE_LIST_CACHE_KEY, generation, templates,
+                settings.template_list_cache_ttl_seconds,
+            )
+            return templates
         except Exception as e:
             logger.error("Failed to list templates: %s", e)
             raise
@@ -742,6 +1113,8 @@ class StorageService:
 
         ARM 유형이면 template_content를 파싱하고,
         Bicep 유형이면 프리컴파일된 compiled_arm_content를 반환한다.
+        파싱 결과는 settings.template_list_cache_ttl_seconds 동안 캐시되며
+        템플릿 수정/삭제 시 무효화된다. 반환값은 공유되므로 수정하지 않는다.
 
         Args:
             template_name: 템플릿 파일명 (RowKey로 사용).
@@ -749,11 +1122,38 @@ class StorageService:
         Returns:
             파싱된 ARM 템플릿 JSON dict. 존재하지 않으면 None.
         """
+        cached = self._template_cache.get(template_name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
-        await self._ensure_tables_exist()
+        return await self._coalesced(
+            f"template:{template_name}", lambda: self._fetch_template(template_name)
+        )
 
+    async def _fetch_template(self, template_name: str) -> dict[str, Any] | None:
+        """배포용 템플릿을 읽어 캐시에 저장한다."""
+        generation = self._template_cache_generation
+        template = await self._load_template(template_name)
+        ttl = settings.template_list_cache_ttl_seconds
+        if (
+            template is not None
+            and ttl > 0
+            and generation == self._template_cache_generation
+        ):
+            self._template_cache[template_name] = (time.monotonic() + ttl, template)
+        return template
+
+    def _invalidate_template_cache(self, template_name: str) -> None:
+        """배포용 템플릿 및 상세 조회 캐시를 무효화한다."""
+        self._template_cache.pop(template_name, None)
+        self._template_detail_cache.pop(template_name, None)
+        self._template_cache_generation += 1
+
+    @_requires_tables
+    async def _load_template(self, template_name: str) -> dict[str, Any] | None:
+        """Table Storage에서 배포용 템플릿을 읽어 파싱한다."""
         try:
-            table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
+            table_client = self._table(TEMPLATES_TABLE)
             entity = await table_client.get_entity(
                 partition_key=TEMPLATE_PARTITION_KEY,
                 row_key=template_name,
@@ -768,9 +1168,9 @@ class StorageService:
                         template_name,
                     )
                     return None
-                return json.loads(compiled)
+                return orjson.loads(compiled)
 
-            return json.loads(entity.get("template_content", "{}"))
+            return orjson.loads(entity.get("template_content", "{}"))
         except ResourceNotFoundError:
             logger.warning("Template not found: %s", template_name)
             return None
@@ -778,36 +1178,50 @@ class StorageService:
             logger.error("Failed to retrieve template: %s", e)
             raise
 
+    @_requires_tables
     async def get_template_detail(self, template_name: str) -> dict[str, Any] | None:
         """템플릿 메타데이터와 콘텐츠를 함께 조회한다.
 
         Args:
             template_name: 템플릿 이름 (RowKey).
 
+        결과는 get_template()과 같은 TTL로 캐시되며 템플릿 수정/삭제 시
+        무효화된다.
+
         Returns:
             name, description, template_content를 포함하는 딕셔너리. 없으면 None.
         """
-        await self._ensure_tables_exist()
+        cached = self._template_detail_cache.get(template_name)
+        if cached is not None and cached[0] > time.monotonic():
+            return dict(cached[1])
 
+        generation = self._template_cache_generation
         try:
-            table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
+            table_client = self._table(TEMPLATES_TABLE)
             entity = await table_client.get_entity(
                 partition_key=TEMPLATE_PARTITION_KEY,
                 row_key=template_name,
             )
-            return {
+            detail = {
                 "name": entity["RowKey"],
                 "description": entity.get("description", ""),
                 "path": entity.get("path", entity["RowKey"]),
                 "template_type": entity.get("template_type", "arm"),
                 "template_content": entity.get("template_content", "{}"),
             }
+            ttl = settings.template_list_cache_ttl_seconds
+            if ttl > 0 and generation == self._template_cache_generation:
+                self._template_detail_cache[template_name] = (
+                    time.monotonic() + ttl, detail,
+                )
+            return dict(detail)
         except ResourceNotFoundError:
             return None
         except Exception as e:
             logger.error("Failed to get template detail '%s': %s", template_name, e)
             raise
 
+    @_requires_tables
     async def update_template(
         self,
         template_name: str,
@@ -831,39 +1245,48 @@ class StorageService:
         Raises:
             EntityNotFoundError: 템플릿이 존재하지 않는 경우.
         """
-        await self._ensure_tables_exist()
+        table_client = self._table(TEMPLATES_TABLE)
 
-        table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
+        # 변경된 필드만 MERGE로 전송한다 (기존 엔티티를 내려받아 다시 쓰지 않음)
+        patch: dict[str, Any] = {
+            "PartitionKey": TEMPLATE_PARTITION_KEY,
+            "RowKey": template_name,
+        }
+        if description is not None:
+            patch["description"] = description
+        if template_content is not None:
+            patch["template_content"] = template_content
+        if template_type is not None:
+            patch["template_type"] = template_type
+        if compiled_arm_content is not None:
+            patch["compiled_arm_content"] = compiled_arm_content
 
         try:
-            entity = await table_client.get_entity(
-                partition_key=TEMPLATE_PARTITION_KEY,
-                row_key=template_name,
-            )
+            await table_client.update_entity(patch, mode=UpdateMode.MERGE)
         except ResourceNotFoundError:
             raise EntityNotFoundError(
                 f"Template '{template_name}' not found"
             )
-
-        if description is not None:
-            entity["description"] = description
-        if template_content is not None:
-            entity["template_content"] = template_content
-        if template_type is not None:
-            entity["template_type"] = template_type
-        if compiled_arm_content is not None:
-            entity["compiled_arm_content"] = compiled_arm_content
-
-        await table_client.update_entity(entity, mode="merge")
+        self._invalidate_list_cache(_TEMPLATE_LIST_CACHE_KEY)
+        self._invalidate_template_cache(template_name)
         logger.info("Updated template: %s", template_name)
 
+        if description is None or template_type is None:
+            # 응답에 필요한 변경되지 않은 필드만 조회 (템플릿 본문 제외)
+            patch = await table_client.get_entity(
+                partition_key=TEMPLATE_PARTITION_KEY,
+                row_key=template_name,
+                select=["RowKey", "description", "path", "template_type"],
+            )
+
         return {
-            "name": entity["RowKey"],
-            "description": entity.get("description", ""),
-            "path": entity.get("path", entity["RowKey"]),
-            "template_type": entity.get("template_type", "arm"),
+            "name": template_name,
+            "description": patch.get("description") or "",
+            "path": patch.get("path") or template_name,
+            "template_type": patch.get("template_type") or "arm",
         }
 
+    @_requires_tables
     async def delete_template(self, template_name: str) -> None:
         """인프라 템플릿을 삭제한다.
 
@@ -873,9 +1296,7 @@ class StorageService:
         Raises:
             EntityNotFoundError: 템플릿이 존재하지 않는 경우.
         """
-        await self._ensure_tables_exist()
-
-        table_client = self.table_service_client.get_table_client(TEMPLATES_TABLE)
+        table_client = self._table(TEMPLATES_TABLE)
 
         try:
             await table_client.get_entity(
@@ -891,6 +1312,8 @@ class StorageService:
             partition_key=TEMPLATE_PARTITION_KEY,
             row_key=template_name,
         )
+        self._invalidate_list_cache(_TEMPLATE_LIST_CACHE_KEY)
+        self._invalidate_template_cache(template_name)
         logger.info("Deleted template: %s", template_name)
 
 
@@ -898,6 +1321,7 @@ class StorageService:
     # Deletion failures
     # ------------------------------------------------------------------
 
+    @_requires_tables
     async def save_deletion_failure(self, failure: DeletionFailureItem) -> bool:
         """삭제 실패 항목을 저장한다.
 
@@ -907,12 +1331,8 @@ class StorageService:
         Returns:
             성공 시 True.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(
-                DELETION_FAILURES_TABLE
-            )
+            table_client = self._table(DELETION_FAILURES_TABLE)
             entity = _failure_to_entity(failure)
             await table_client.upsert_entity(entity)
             logger.info(
@@ -925,12 +1345,53 @@ class StorageService:
             logger.error("Failed to save deletion failure: %s", e)
             raise
 
+    @_requires_tables
+    async def save_deletion_failures(
+        self, failures: list[DeletionFailureItem]
+    ) -> None:
+        """삭제 실패 항목들을 entity group transaction으로 일괄 저장한다.
+
+        같은 워크샵의 항목은 같은 파티션이므로 최대 100개씩 한 번의 요청으로
+        upsert한다. 여러 워크샵의 항목이 섞여 있으면 워크샵별로 나눈다.
+
+        Args:
+            failures: 삭제 실패 항목 목록.
+        """
+        if not failures:
+            return
+
+        by_partition: dict[str, list[dict[str, Any]]] = {}
+        for failure in failures:
+            by_partition.setdefault(failure.workshop_id, []).append(
+                _failure_to_entity(failure)
+            )
+
+        table_client = self._table(DELETION_FAILURES_TABLE)
+        try:
+            await asyncio.gather(*(
+                table_client.submit_transaction(
+                    [("upsert", e) for e in entities[i:i + _MAX_TRANSACTION_OPERATIONS]]
+                )
+                for entities in by_partition.values()
+                for i in range(0, len(entities), _MAX_TRANSACTION_OPERATIONS)
+            ))
+            logger.info(
+                "Saved %d deletion failure(s) for %d workshop(s)",
+                len(failures),
+                len(by_partition),
+            )
+        except Exception as e:
+            logger.error("Failed to save deletion failures: %s", e)
+            raise
+
+    @_requires_tables
     async def list_deletion_failures_by_workshop(
         self, workshop_id: str
     ) -> list[DeletionFailureItem]:
         """워크샵별 삭제 실패 항목을 조회한다.
 
-        PK=workshop_id 단일 파티션 쿼리로 최적화된다.
+        PK=workshop_id 단일 파티션 쿼리로 최적화된다. new_deletion_failure_id()로
+        만든 RowKey는 서버에서 최신순으로 반환되므로 클라이언트 정렬이 필요 없다.
 
         Args:
             workshop_id: 워크샵 고유 식별자.
@@ -938,20 +1399,21 @@ class StorageService:
         Returns:
             삭제 실패 항목 목록 (failed_at 내림차순).
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(
-                DELETION_FAILURES_TABLE
-            )
-            query_filter = f"PartitionKey eq '{workshop_id}'"
+            table_client = self._table(DELETION_FAILURES_TABLE)
+            query_filter = f"PartitionKey eq {_odata_str(workshop_id)}"
             failures = [
                 _entity_to_failure(e)
-                async for e in table_client.query_entities(query_filter)
+                async for e in table_client.query_entities(
+                    query_filter, results_per_page=_QUERY_PAGE_SIZE
+                )
             ]
-            failures.sort(
-                key=lambda x: x.get("failed_at", ""), reverse=True
-            )
+            # 역순 타임스탬프 키는 이미 최신순이다. uuid 키로 저장된 기존
+            # 항목이 섞여 있을 때만 직접 정렬한다.
+            if not all(_INVERTED_KEY_RE.match(f["id"]) for f in failures):
+                failures.sort(
+                    key=lambda x: x.get("failed_at", ""), reverse=True
+                )
             return failures
         except Exception as e:
             logger.error(
@@ -961,6 +1423,7 @@ class StorageService:
             )
             raise
 
+    @_requires_tables
     async def update_deletion_failure(
         self, failure_id: str, workshop_id: str, updates: dict[str, Any]
     ) -> bool:
@@ -974,24 +1437,21 @@ class StorageService:
         Returns:
             성공 시 True.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(
-                DELETION_FAILURES_TABLE
-            )
+            table_client = self._table(DELETION_FAILURES_TABLE)
             entity = {
                 "PartitionKey": workshop_id,
                 "RowKey": failure_id,
                 **updates,
             }
             await table_client.update_entity(entity, mode="merge")
-            logger.info("Updated deletion failure: %s", failure_id)
+            logger.debug("Updated deletion failure: %s", failure_id)
             return True
         except Exception as e:
             logger.error("Failed to update deletion failure %s: %s", failure_id, e)
             raise
 
+    @_requires_tables
     async def delete_deletion_failure(
         self, failure_id: str, workshop_id: str
     ) -> bool:
@@ -1004,12 +1464,8 @@ class StorageService:
         Returns:
             성공 시 True.
         """
-        await self._ensure_tables_exist()
-
         try:
-            table_client = self.table_service_client.get_table_client(
-                DELETION_FAILURES_TABLE
-            )
+            table_client = self._table(DELETION_FAILURES_TABLE)
             await table_client.delete_entity(
                 partition_key=workshop_id,
                 row_key=failure_id,
@@ -1021,6 +1477,66 @@ class StorageService:
             raise
 
 
+# ------------------------------------------------------------------
+# Key validation helpers
+# ------------------------------------------------------------------
+
+
+def new_deletion_failure_id(failed_at: str) -> str:
+    """삭제 실패 항목 ID(RowKey)를 생성한다.
+
+    failed_at을 역순 밀리초 타임스탬프로 앞에 붙여 파티션 내에서
+    최신 항목이 먼저 정렬되도록 한다.
+
+    Args:
+        failed_at: ISO 8601 형식의 실패 시각.
+
+    Returns:
+        "{역순 타임스탬프:019d}_{uuid}" 형식의 ID.
+    """
+    try:
+        failed = datetime.fromisoformat(failed_at)
+    except ValueError:
+        failed = datetime.now(timezone.utc)
+    if failed.tzinfo is None:
+        failed = failed.replace(tzinfo=timezone.utc)
+    inverted = _MAX_TICKS - int(failed.timestamp() * 1000)
+    return f"{inverted:019d}_{uuid.uuid4().hex}"
+
+
+def _validate_key(value: str, field: str) -> None:
+    """Table Storage PartitionKey/RowKey로 사용할 수 있는 값인지 검증한다.
+
+    Raises:
+        InvalidFormatError: 비어 있거나, 금지 문자가 있거나, 1KiB를 넘는 경우.
+    """
+    if (
+        not value
+        or _INVALID_KEY_CHARS_RE.search(value)
+        or len(value.encode("utf-8")) > _MAX_KEY_BYTES
+    ):
+        raise InvalidFormatError(
+            f"Invalid {field}: must be non-empty, at most 1KiB and must not "
+            "contain '/', '\\', '#', '?' or control characters",
+            field=field,
+        )
+
+
+def _odata_str(value: str) -> str:
+    """OData 필터용 문자열 리터럴로 변환한다 (작은따옴표 이스케이프)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+# ------------------------------------------------------------------
+# JSON serialization helpers
+# ------------------------------------------------------------------
+
+
+def _dumps_json(data: Any) -> str:
+    """Table Storage 문자열 프로퍼티용 JSON을 orjson으로 직렬화한다."""
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+
+
 # ------------------------------------------------------------------
 # Snapshot compression helpers (gzip + base64)
 # ------------------------------------------------------------------
@@ -1034,7 +1550,7 @@ def _compress_json(data: dict | list | None) -> str:
     """
     if data is None:
         return ""
-    raw = json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+    raw = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
     return base64.b64encode(gzip.compress(raw)).decode("ascii")
 
 
@@ -1047,11 +1563,11 @@ def _decompress_json(encoded: str | None) -> dict | list | None:
         return None
     try:
         raw = gzip.decompress(base64.b64decode(encoded))
-        return json.loads(raw)
+        return orjson.loads(raw)
     except Exception:
         # Fall back: try plain JSON (migration compat)
         try:
-            return json.loads(encoded)
+            return orjson.loads(encoded)
         except Exception:
             return None
 
@@ -1081,38 +1597,53 @@ def _workshop_to_entity(workshop_id: str, metadata: dict[str, Any]) -> dict[str,
         "description": metadata.get("description", ""),
         "survey_url": metadata.get("survey_url", ""),
         # JSON-serialized complex fields
-        "participants_json": json.dumps(
-            metadata.get("participants", []), default=str
+        # 참가자 목록은 인원에 비례해 커지므로 압축 저장 (64KB 제한 및 전송량 절감)
+        "participants_json_gz": _compress_json(metadata.get("participants", [])),
+        "planned_participants_json_gz": _compress_json(
+            metadata.get("planned_participants", [])
         ),
-        "planned_participants_json": json.dumps(
-            metadata.get("planned_participants", []), default=str
-        ),
-        "policy_json": json.dumps(metadata.get("policy", {}), default=str),
+        # upsert는 MERGE이므로 구버전 비압축 컬럼을 비워 중복 저장을 없앤다
+        "participants_json": "",
+        "planned_participants_json": "",
+        "policy_json": _dumps_json(metadata.get("policy", {})),
         # Snapshot fields (compressed to stay within 64KB Table Storage limit)
         "cost_snapshot_json": _compress_json(metadata.get("cost_snapshot")),
         "resource_snapshot_json": _compress_json(metadata.get("resource_snapshot")),
     }
 
 
+def _load_json_list(entity: dict[str, Any], field: str) -> list:
+    """압축 필드({field}_gz)를 우선 읽고, 없으면 구버전 비압축 필드로 폴백한다."""
+    encoded = entity.get(f"{field}_gz")
+    if encoded:
+        return _decompress_json(encoded) or []
+    return orjson.loads(entity.get(field) or "[]")
+
+
 def _entity_to_workshop(entity: dict[str, Any]) -> dict[str, Any]:
-    """Table Storage 엔티티를 워크샵 메타데이터 dict로 변환한다."""
+    """Table Storage 엔티티를 워크샵 메타데이터 dict로 변환한다.
+
+    $select로 조회하면 행에 없는 컬럼도 None으로 채워지므로 기본값은
+    .get(k, default)가 아니라 `or`로 적용한다.
+    """
+    get = entity.get
     return {
         "id": entity["RowKey"],
-        "name": entity.get("name", ""),
-        "start_date": entity.get("start_date", ""),
-        "end_date": entity.get("end_date", ""),
-        "base_resources_template": entity.get("base_resources_template", ""),
-        "deployment_region": entity.get("deployment_region", ""),
-        "status": entity.get("status", "active"),
-        "created_at": entity.get("created_at", ""),
-        "created_by": entity.get("created_by"),
-        "description": entity.get("description"),
-        "survey_url": entity.get("survey_url", ""),
-        "participants": json.loads(entity.get("participants_json", "[]")),
-        "planned_participants": json.loads(entity.get("planned_participants_json", "[]")),
-        "policy": json.loads(entity.get("policy_json", "{}")),
-        "cost_snapshot": _decompress_json(entity.get("cost_snapshot_json", "")),
-        "resource_snapshot": _decompress_json(entity.get("resource_snapshot_json", "")),
+        "name": get("name") or "",
+        "start_date": get("start_date") or "",
+        "end_date": get("end_date") or "",
+        "base_resources_template": get("base_resources_template") or "",
+        "deployment_region": get("deployment_region") or "",
+        "status": get("status") or "active",
+        "created_at": get("created_at") or "",
+        "created_by": get("created_by"),
+        "description": get("description"),
+        "survey_url": get("survey_url") or "",
+        "participants": _load_json_list(entity, "participants_json"),
+        "planned_participants": _load_json_list(entity, "planned_participants_json"),
+        "policy": orjson.loads(get("policy_json") or "{}"),
+        "cost_snapshot": _decompress_json(get("cost_snapshot_json")),
+        "resource_snapshot": _decompress_json(get("resource_snapshot_json")),
     }
 
 
@@ -1132,6 +1663,19 @@ def _failure_to_entity(failure: DeletionFailureItem) -> dict[str, Any]:
     }
 
 
+def _entity_to_user(entity: dict[str, Any]) -> dict[str, Any]:
+    """Table Storage 엔티티를 포털 사용자 dict로 변환한다."""
+    get = entity.get
+    return {
+        "user_id": get("user_id") or "",
+        "name": get("name") or "",
+        "email": entity["RowKey"],
+        "role": get("role") or "user",
+        "status": get("status") or "active",
+        "registered_at": get("registered_at") or "",
+    }
+
+
 def _entity_to_failure(entity: dict[str, Any]) -> dict[str, Any]:
     """Table Storage 엔티티를 삭제 실패 항목 dict로 변환한다."""
     return {
@@ -6,11 +6,11 @@ from datetime import datetime
 from functools import lru_cache
 from typing import Any
 
-from azure.mgmt.resource import SubscriptionClient
+from azure.mgmt.resource.subscriptions.aio import SubscriptionClient
 
 from app.config import settings
 from app.exceptions import InsufficientSubscriptionsError, ServiceUnavailableError
-from app.services.credential import get_azure_credential
+from app.services.credential import get_shared_async_azure_credential
 from app.services.storage import storage_service
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class SubscriptionService:
     """Azure 구독을 조회하고 참가자에게 배정한다."""
 
     def __init__(self) -> None:
-        self._credential = get_azure_credential()
+        self._credential = get_shared_async_azure_credential()
         self._azure_cache: list[dict[str, str]] = []
         self._cache_time: float = 0.0
         self._revalidation_task: asyncio.Task | None = None
@@ -59,25 +59,14 @@ class SubscriptionService:
             logger.warning("Background subscription refresh failed: %s", e)
 
     async def _fetch_azure_subscriptions(self) -> list[dict[str, str]]:
-        def _list_subscriptions() -> list[dict[str, str]]:
-            client = SubscriptionClient(credential=self._credential)
-            try:
-                subscriptions: list[dict[str, str]] = []
-                for sub in client.subscriptions.list():
-                    subscriptions.append(
-                        {
-                            "subscription_id": sub.subscription_id,
-                            "display_name": getattr(sub, "display_name", ""),
-                        }
-                    )
-                return subscriptions
-            finally:
-                try:
-                    client.close()
-                except Exception:
-                    pass
-
-        return await asyncio.to_thread(_list_subscriptions)
+        async with SubscriptionClient(credential=self._credential) as client:
+            return [
+                {
+                    "subscription_id": sub.subscription_id,
+                    "display_name": getattr(sub, "display_name", ""),
+                }
+                async for sub in client.subscriptions.list()
+            ]
 
     async def _get_azure_subscriptions(self, force_refresh: bool = False) -> tuple[list[dict[str, str]], bool]:
         if self._cache_valid() and not force_refresh:
@@ -164,12 +153,11 @@ class SubscriptionService:
         if pool_size == 0:
             raise ServiceUnavailableError("No available subscriptions to assign")
 
-        workshops = await storage_service.list_all_workshops()
         new_start = datetime.fromisoformat(start_date)
         new_end = datetime.fromisoformat(end_date)
 
         overlapping_count = 0
-        for ws in workshops:
+        async for ws in storage_service.aiter_workshops(include_snapshots=False):
             if ws.get("status") not in ("active", "creating", "scheduled"):
                 continue
             if exclude_workshop_id and ws.get("id") == exclude_workshop_id:
@@ -0,0 +1,79 @@
+"""Azure SDK 비동기 클라이언트용 HTTP transport와 재시도 정책.
+
+azure-core 기본 aiohttp transport는 커넥션 풀 크기와 keep-alive 시간이
+작아 벌크 작업(리소스 그룹 일괄 생성/삭제 등)에서 요청이 대기하거나
+유휴 후 TLS 핸드셰이크를 다시 수행한다. 여러 클라이언트가 공유할 수 있도록
+풀 설정을 조정한 transport를 제공한다.
+
+기본 재시도 정책은 지터 없는 지수 백오프를 쓰고 Retry-After를 상한 없이
+따르므로, 벌크 작업 중 함께 throttling된 요청들이 같은 시점에 다시 몰린다.
+지터와 Retry-After 상한을 적용한 정책을 함께 제공한다.
+"""
+import random
+from typing import Any
+
+import aiohttp
+from azure.core.pipeline import PipelineResponse
+from azure.core.pipeline.policies import AsyncRetryPolicy
+from azure.core.pipeline.transport import AioHttpTransport
+
+from app.config import settings
+
+# 커넥션 풀 설정 (호스트당 상한은 settings.azure_http_pool_size_per_host)
+_POOL_LIMIT = 256
+_KEEPALIVE_TIMEOUT_SECONDS = 120
+_DNS_CACHE_TTL_SECONDS = 300
+
+
+class TunedAioHttpTransport(AioHttpTransport):
+    """커넥션 풀을 확장한 aiohttp transport.
+
+    aiohttp 세션은 이벤트 루프가 실행 중일 때 생성해야 하므로, 서비스 싱글턴이
+    모듈 import 시점에 생성되더라도 첫 요청에서 세션을 연다.
+    여러 클라이언트가 공유하며, 세션은 transport가 소유하여 close() 시 닫힌다.
+    """
+
+    async def open(self) -> None:
+        if self.session is None and self._session_owner:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_POOL_LIMIT,
+                    limit_per_host=min(
+                        settings.azure_http_pool_size_per_host, _POOL_LIMIT
+                    ),
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT_SECONDS,
+                    ttl_dns_cache=_DNS_CACHE_TTL_SECONDS,
+                    enable_cleanup_closed=True,
+                ),
+                trust_env=self._use_env_settings,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+            )
+        await super().open()
+
+
+class JitteredAsyncRetryPolicy(AsyncRetryPolicy):
+    """지수 백오프에 지터를 더하고 Retry-After를 backoff_max로 제한하는 재시도 정책."""
+
+    def get_backoff_time(self, settings: dict[str, Any]) -> float:
+        # 계산된 백오프의 절반~전체 구간에서 고르게 대기한다 (equal jitter)
+        backoff = super().get_backoff_time(settings)
+        return random.uniform(backoff / 2, backoff) if backoff > 0 else 0
+
+    def get_retry_after(self, response: PipelineResponse) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+
+def azure_retry_policy() -> JitteredAsyncRetryPolicy:
+    """설정값(settings.azure_retry_*)으로 재시도 정책을 생성한다.
+
+    정책은 요청별 상태를 갖지 않으므로 클라이언트마다 새로 만들어 전달한다.
+    """
+    return JitteredAsyncRetryPolicy(
+        retry_total=settings.azure_retry_total,
+        retry_backoff_factor=settings.azure_retry_backoff_factor,
+        retry_backoff_max=settings.azure_retry_backoff_max,
+    )
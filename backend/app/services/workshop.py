@@ -10,14 +10,14 @@ from datetime import UTC, datetime, timedelta, timezone
 from typing import Any, Optional
 
 from app.config import settings
-from app.exceptions import AppError, GroupMembershipError, InvalidDateRangeError, InvalidInputError, NotFoundError, PolicyNotFoundError
+from app.exceptions import AppError, GroupMembershipError, InvalidDateRangeError, InvalidInputError, NotFoundError
 from app.models import DeletionFailureItem, MessageResponse, WorkshopCreateInput, WorkshopDetail, WorkshopResponse
 from app.services.cost import cost_service
 from app.services.email import email_service
 from app.services.entra_id import entra_id_service
-from app.services.policy import policy_service
+from app.services.policy import get_policy_service
 from app.services.resource_manager import resource_manager_service
-from app.services.storage import storage_service
+from app.services.storage import new_deletion_failure_id, storage_service
 from app.services.subscription import subscription_service
 from app.utils.csv_parser import parse_participants_csv
 
@@ -26,6 +26,11 @@ logger = logging.getLogger(__name__)
 WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT = "workshop-allowed-locations"
 WORKSHOP_DENIED_RESOURCES_ASSIGNMENT = "workshop-denied-resources"
 WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT = "workshop-allowed-vm-skus"
+WORKSHOP_POLICY_ASSIGNMENTS = (
+    WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
+    WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
+    WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
+)
 
 WORKSHOP_STATUS_ACTIVE = "active"
 WORKSHOP_STATUS_CLEANING_UP = "cleaning_up"
@@ -311,16 +316,23 @@ class WorkshopService:
         cost=cost_service,
         entra_id=entra_id_service,
         resource_mgr=resource_manager_service,
-        policy=policy_service,
+        policy=None,
         subscription_service_instance=subscription_service,
     ) -> None:
         self.storage = storage
         self.cost = cost
         self.entra_id = entra_id
         self.resource_mgr = resource_mgr
-        self.policy = policy
+        self._policy = policy
         self.subscription_service = subscription_service_instance
 
+    @property
+    def policy(self):
+        """PolicyService 싱글턴을 lazy-load한다."""
+        if self._policy is None:
+            self._policy = get_policy_service()
+        return self._policy
+
     @staticmethod
     def build_cost_specs(participants: list[dict]) -> list[dict]:
         """참가자 목록에서 비용 조회용 스펙을 추출한다 (구독 레벨)."""
@@ -340,12 +352,18 @@ class WorkshopService:
             )
         return metadata
 
-    async def list_workshops(self) -> list[WorkshopResponse]:
+    async def list_workshops(self, limit: Optional[int] = None) -> list[WorkshopResponse]:
         """전체 워크샵 목록을 조회한다 (비용 정보 제외).
 
         비용 정보는 별도의 get_workshops_costs()를 통해 lazy-load한다.
+
+        Args:
+            limit: 지정 시 created_at 기준 최신 N개만 반환한다.
         """
-        workshops = await self.storage.list_all_workshops()
+        workshops = await self.storage.list_all_workshops(include_snapshots=False)
+        if limit is not None:
+            # 저장소 결과는 이미 최신순으로 정렬되어 캐시되므로 앞부분만 변환한다
+            workshops = workshops[:limit]
 
         return [
             WorkshopResponse(
@@ -375,7 +393,7 @@ class WorkshopService:
         Returns:
             워크샵 ID를 키로, {estimated_cost, currency}를 값으로 가지는 딕셔너리.
         """
-        workshops = await self.storage.list_all_workshops()
+        workshops = await self.storage.list_all_workshops(include_snapshots=False)
 
         async def _fetch_cost(workshop: dict) -> tuple[str, dict]:
             """단일 워크샵의 비용을 조회한다."""
@@ -500,25 +518,15 @@ class WorkshopService:
 
         # Roll back policy assignments on subscription scope
         for subscription_id in assigned_subscription_ids:
-            sub_scope = f"/subscriptions/{subscription_id}"
-            for assignment_name in (
-                WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
-                WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
-                WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
-            ):
-                try:
-                    await self.policy.delete_policy_assignment(
-                        scope=sub_scope,
-                        assignment_name=assignment_name,
-                        subscription_id=subscription_id,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Rollback: failed to remove policy %s on %s: %s",
-                        assignment_name,
-                        subscription_id,
-                        e,
-                    )
+            deleted = await self.policy.delete_policy_assignments(
+                scope=f"/subscriptions/{subscription_id}",
+                assignment_names=WORKSHOP_POLICY_ASSIGNMENTS,
+                subscription_id=subscription_id,
+            )
+            if not all(deleted.values()):
+                logger.warning(
+                    "Rollback: failed to remove some policies on %s", subscription_id,
+                )
 
         if created_rg_specs:
             try:
@@ -1480,43 +1488,50 @@ class WorkshopService:
 
         # Scheduled workshops: delete pre-created Entra ID users + metadata
         if metadata.get("status") == WORKSHOP_STATUS_SCHEDULED:
-            # Delete pre-created Entra ID users (created disabled at schedule time)
             planned = metadata.get("planned_participants", [])
-            if planned:
+
+            async def _delete_planned_users() -> None:
+                """예약 시 비활성 상태로 미리 생성한 Entra ID 사용자를 삭제한다."""
                 upns = [p["upn"] for p in planned if p.get("upn")]
+                if not upns:
+                    return
                 upn_to_oid = {
                     p["upn"]: p["object_id"]
                     for p in planned
                     if p.get("upn") and p.get("object_id")
                 }
-                if upns:
-                    try:
-                        results = await self.entra_id.delete_users_bulk(
-                            upns, upn_to_object_id=upn_to_oid,
-                        )
-                        deleted_count = sum(1 for v in results.values() if v)
+                try:
+                    results = await self.entra_id.delete_users_bulk(
+                        upns, upn_to_object_id=upn_to_oid,
+                    )
+                    deleted_count = sum(1 for v in results.values() if v)
+                    logger.info(
+                        "Deleted %d/%d Entra ID users for scheduled workshop %s",
+                        deleted_count, len(upns), workshop_id,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to delete Entra ID users for scheduled workshop %s: %s",
+                        workshop_id, e,
+                    )
+
+            async def _release_subscriptions() -> None:
+                """워크샵에 예약된 구독을 반환한다."""
+                try:
+                    released = await self.storage.release_subscriptions_by_workshop(workshop_id)
+                    if released:
                         logger.info(
-                            "Deleted %d/%d Entra ID users for scheduled workshop %s",
-                            deleted_count, len(upns), workshop_id,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to delete Entra ID users for scheduled workshop %s: %s",
-                            workshop_id, e,
+                            "Released %d subscription(s) for scheduled workshop %s",
+                            len(released), workshop_id,
                         )
-
-            try:
-                released = await self.storage.release_subscriptions_by_workshop(workshop_id)
-                if released:
-                    logger.info(
-                        "Released %d subscription(s) for scheduled workshop %s",
-                        len(released), workshop_id,
+                except Exception as e:
+                    logger.warning(
+                        "Failed to release subscriptions for scheduled workshop %s: %s",
+                        workshop_id, e,
                     )
-            except Exception as e:
-                logger.warning(
-                    "Failed to release subscriptions for scheduled workshop %s: %s",
-                    workshop_id, e,
-                )
+
+            # Entra ID(Graph)와 Table Storage 호출은 서로 독립적이므로 동시에 수행
+            await asyncio.gather(_delete_planned_users(), _release_subscriptions())
 
             await self.storage.delete_workshop_metadata(workshop_id)
             planned_count = len(planned)
@@ -1575,31 +1590,12 @@ class WorkshopService:
 
             if subscription_id and subscription_id not in seen_subs:
                 seen_subs.add(subscription_id)
-                sub_scope = f"/subscriptions/{subscription_id}"
-                sub_policy_ok = True
-                for assignment_name in (
-                    WORKSHOP_ALLOWED_LOCATIONS_ASSIGNMENT,
-                    WORKSHOP_DENIED_RESOURCES_ASSIGNMENT,
-                    WORKSHOP_ALLOWED_VM_SKUS_ASSIGNMENT,
-                ):
-                    try:
-                        await self.policy.delete_policy_assignment(
-                            scope=sub_scope,
-                            assignment_name=assignment_name,
-                            subscription_id=subscription_id,
-                        )
-                    except PolicyNotFoundError:
-                        # Already removed — treat as success
-                        pass
-                    except Exception as e:
-                        sub_policy_ok = False
-                        logger.warning(
-                            "Failed to remove policy %s on %s: %s",
-                            assignment_name,
-                            subscription_id,
-                            e,
-                        )
-                policy_status[subscription_id] = sub_policy_ok
+                deleted = await self.policy.delete_policy_assignments(
+                    scope=f"/subscriptions/{subscription_id}",
+                    assignment_names=WORKSHOP_POLICY_ASSIGNMENTS,
+                    subscription_id=subscription_id,
+                )
+                policy_status[subscription_id] = all(deleted.values())
 
             if rg_name:
                 rg_specs.append({
@@ -1626,7 +1622,7 @@ class WorkshopService:
             if not ok:
                 failures.append(
                     DeletionFailureItem(
-                        id=str(uuid.uuid4()),
+                        id=new_deletion_failure_id(now_iso),
                         workshop_id=workshop_id,
                         workshop_name=workshop_name,
                         resource_type="policy",
@@ -1644,7 +1640,7 @@ class WorkshopService:
             if rg_name and not rg_status.get(rg_name, False):
                 failures.append(
                     DeletionFailureItem(
-                        id=str(uuid.uuid4()),
+                        id=new_deletion_failure_id(now_iso),
                         workshop_id=workshop_id,
                         workshop_name=workshop_name,
                         resource_type="resource_group",
@@ -1662,7 +1658,7 @@ class WorkshopService:
             if upn and not user_status.get(upn, False):
                 failures.append(
                     DeletionFailureItem(
-                        id=str(uuid.uuid4()),
+                        id=new_deletion_failure_id(now_iso),
                         workshop_id=workshop_id,
                         workshop_name=workshop_name,
                         resource_type="user",
@@ -1676,8 +1672,7 @@ class WorkshopService:
                 )
 
         if failures:
-            for failure in failures:
-                await self.storage.save_deletion_failure(failure)
+            await self.storage.save_deletion_failures(failures)
 
             metadata["status"] = WORKSHOP_STATUS_FAILED
             await self.storage.save_workshop_metadata(workshop_id, metadata)
@@ -0,0 +1,91 @@
+"""테스트 공용 fixture.
+
+Azure SDK 클라이언트를 메모리 내 가짜 객체로 바꿔 네트워크 없이
+StorageService의 캐시·키 설계 로직만 검증한다.
+"""
+import asyncio
+from typing import Any
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from azure.data.tables import TableEntity
+
+from app.services import storage as storage_module
+from app.services.storage import StorageService
+
+
+class FakeTableClient:
+    """조회/MERGE 갱신/트랜잭션만 흉내 내는 TableClient."""
+
+    def __init__(self) -> None:
+        self.entities: list[dict[str, Any]] = []
+        self.query_count = 0
+        self.transactions: list[list[tuple[str, dict[str, Any]]]] = []
+        self.updates: list[tuple[Any, dict[str, Any]]] = []
+
+    async def query_entities(
+        self, query_filter: str, select: list[str] | None = None, **kwargs: Any
+    ):
+        self.query_count += 1
+        for entity in list(self.entities):
+            if select is None:
+                yield entity
+            else:
+                # 실제 서비스처럼 행에 없는 선택 컬럼은 None으로 채운다
+                yield {field: entity.get(field) for field in select}
+
+    def _find(self, partition_key: str, row_key: str) -> dict[str, Any]:
+        for entity in self.entities:
+            if entity["PartitionKey"] == partition_key and entity["RowKey"] == row_key:
+                return entity
+        raise ResourceNotFoundError("The specified resource does not exist.")
+
+    async def get_entity(
+        self, partition_key: str, row_key: str, select: list[str] | None = None,
+        **kwargs: Any,
+    ) -> TableEntity:
+        entity = self._find(partition_key, row_key)
+        result = TableEntity(
+            entity if select is None else {field: entity.get(field) for field in select}
+        )
+        result._metadata = {"etag": f"W/\"{id(entity)}\"", "timestamp": None}
+        return result
+
+    async def update_entity(self, entity: dict[str, Any], mode: Any, **kwargs: Any):
+        self.updates.append((mode, dict(entity)))
+        self._find(entity["PartitionKey"], entity["RowKey"]).update(entity)
+
+    async def submit_transaction(self, operations):
+        self.transactions.append(list(operations))
+        self.entities.extend(entity for _, entity in operations)
+
+
+class FakeTableServiceClient:
+    """테이블 생성 확인 호출 수를 기록하는 TableServiceClient."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.created: list[str] = []
+        self.tables: dict[str, FakeTableClient] = {}
+
+    async def create_table_if_not_exists(self, table_name: str) -> None:
+        await asyncio.sleep(0)
+        self.created.append(table_name)
+
+    def get_table_client(self, table_name: str) -> FakeTableClient:
+        return self.tables.setdefault(table_name, FakeTableClient())
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def storage(monkeypatch: pytest.MonkeyPatch) -> StorageService:
+    """가짜 Table Storage 클라이언트를 사용하는 StorageService."""
+    monkeypatch.setattr(storage_module, "TableServiceClient", FakeTableServiceClient)
+    monkeypatch.setattr(storage_module, "TunedAioHttpTransport", lambda: None)
+    monkeypatch.setattr(
+        storage_module, "get_shared_async_azure_credential", lambda: None
+    )
+    monkeypatch.setattr(StorageService, "_tables_initialized", True)
+    monkeypatch.setattr(StorageService, "_tables_init_task", None)
+    return StorageService()
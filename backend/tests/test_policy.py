@@ -0,0 +1,36 @@
+"""PolicyService 싱글턴 종료 테스트."""
+import asyncio
+
+import pytest
+
+from app.services import policy as policy_module
+
+
+class FakePolicyService:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_close_skips_service_that_was_never_created(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(policy_module, "_policy_service_singleton", None)
+    monkeypatch.setattr(
+        policy_module, "PolicyService",
+        lambda: pytest.fail("close must not create PolicyService"),
+    )
+
+    asyncio.run(policy_module.close_policy_service())
+
+    assert policy_module._policy_service_singleton is None
+
+
+def test_close_closes_and_clears_existing_service(monkeypatch: pytest.MonkeyPatch):
+    service = FakePolicyService()
+    monkeypatch.setattr(policy_module, "_policy_service_singleton", service)
+
+    asyncio.run(policy_module.close_policy_service())
+
+    assert service.closed
+    assert policy_module._policy_service_singleton is None
@@ -0,0 +1,274 @@
+"""ResourceManagerService 리소스 타입 캐시 테스트."""
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.services import resource_manager as rm_module
+from app.services import storage as storage_module
+from app.services.resource_manager import (
+    _RESOURCE_TYPES_CACHE_TTL,
+    _RESOURCE_TYPES_RETRY_TTL,
+    _RESOURCE_TYPES_STALE_LIMIT,
+    _RESOURCE_TYPES_TTL_JITTER,
+    ResourceManagerService,
+)
+
+COMPUTE = "Microsoft.Compute"
+WEB = "Microsoft.Web"
+
+
+class FakeClock:
+    """monotonic/time을 테스트에서 직접 진행시키는 시계."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+class FakeProviders:
+    """providers.get 호출을 기록하고 지정한 네임스페이스는 실패시킨다."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.failing: set[str] = set()
+
+    async def get(self, namespace: str) -> Any:
+        self.calls.append(namespace)
+        await asyncio.sleep(0)
+        if namespace in self.failing:
+            raise RuntimeError(f"{namespace} unavailable")
+        resource_type = namespace.split(".")[-1].lower()
+        return SimpleNamespace(
+            resource_types=[SimpleNamespace(resource_type=resource_type)]
+        )
+
+
+class FakeCacheStore:
+    """Table Storage 리소스 타입 캐시 조회/저장 호출을 기록한다."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.saved: list[list[dict[str, str]]] = []
+
+    async def get_resource_types_cache(self, cache_key: str):
+        self.reads += 1
+        return None, None
+
+    async def set_resource_types_cache(self, cache_key: str, resource_types):
+        self.saved.append(resource_types)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rm_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def providers() -> FakeProviders:
+    return FakeProviders()
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> FakeCacheStore:
+    fake = FakeCacheStore()
+    monkeypatch.setattr(storage_module, "storage_service", fake)
+    return fake
+
+
+@pytest.fixture
+def service(
+    monkeypatch: pytest.MonkeyPatch, clock: FakeClock, providers: FakeProviders,
+    store: FakeCacheStore,
+) -> ResourceManagerService:
+    """클래스 레벨 캐시를 비우고 가짜 ARM 클라이언트를 쓰는 서비스."""
+    monkeypatch.setattr(rm_module, "get_shared_async_azure_credential", lambda: None)
+    monkeypatch.setattr(rm_module, "TunedAioHttpTransport", lambda: None)
+    for name, value in {
+        "_resource_types_cache": [],
+        "_resource_types_expires_at": 0.0,
+        "_resource_types_fetched_at": 0.0,
+        "_provider_types_cache": {},
+        "_provider_types_failures": {},
+        "_resource_types_lock": asyncio.Lock(),
+        "_resource_types_refresh_task": None,
+    }.items():
+        monkeypatch.setattr(ResourceManagerService, name, value)
+    monkeypatch.setattr(
+        ResourceManagerService, "_resource_types_ttl",
+        staticmethod(lambda: float(_RESOURCE_TYPES_CACHE_TTL)),
+    )
+    svc = ResourceManagerService()
+    monkeypatch.setattr(
+        svc, "_get_resource_client", lambda: SimpleNamespace(providers=providers)
+    )
+    return svc
+
+
+_jittered_ttl = ResourceManagerService._resource_types_ttl
+
+
+def _values(resource_types: list[dict[str, str]]) -> list[str]:
+    return [rt["value"] for rt in resource_types]
+
+
+# ------------------------------------------------------------------
+# 부분 실패
+# ------------------------------------------------------------------
+
+
+def test_partial_failure_is_cached_until_retry(
+    service: ResourceManagerService, providers: FakeProviders,
+    store: FakeCacheStore, clock: FakeClock,
+):
+    providers.failing.add(WEB)
+
+    async def _run():
+        return [await service.get_resource_types([COMPUTE, WEB]) for _ in range(5)]
+
+    results = asyncio.run(_run())
+
+    assert all(_values(r) == ["Microsoft.Compute/compute"] for r in results)
+    assert sorted(providers.calls) == [COMPUTE, WEB]
+    assert store.reads == 1
+    # 일부만 조회된 결과는 Table Storage에 저장하지 않는다
+    assert store.saved == []
+
+
+def test_failing_namespace_retry_backs_off(
+    service: ResourceManagerService, providers: FakeProviders, clock: FakeClock,
+):
+    providers.failing.add(WEB)
+
+    async def _refresh_after(seconds: float) -> None:
+        clock.now += seconds
+        await service.get_resource_types([COMPUTE, WEB])
+        task = ResourceManagerService._resource_types_refresh_task
+        if task is not None:
+            await task
+
+    async def _run():
+        await service.get_resource_types([COMPUTE, WEB])
+        # 첫 실패 후 60초, 두 번째 실패 후 120초 동안 재조회하지 않는다
+        await _refresh_after(_RESOURCE_TYPES_RETRY_TTL + 1)
+        await _refresh_after(_RESOURCE_TYPES_RETRY_TTL + 1)
+        web_calls_before_backoff = providers.calls.count(WEB)
+        await _refresh_after(_RESOURCE_TYPES_RETRY_TTL)
+        return web_calls_before_backoff
+
+    assert asyncio.run(_run()) == 2
+    assert providers.calls.count(WEB) == 3
+    assert providers.calls.count(COMPUTE) == 1
+
+
+def test_recovered_namespace_is_merged_and_persisted(
+    service: ResourceManagerService, providers: FakeProviders,
+    store: FakeCacheStore, clock: FakeClock,
+):
+    providers.failing.add(WEB)
+
+    async def _run():
+        await service.get_resource_types([COMPUTE, WEB])
+        providers.failing.clear()
+        clock.now += _RESOURCE_TYPES_RETRY_TTL + 1
+        await service.get_resource_types([COMPUTE, WEB])
+        await ResourceManagerService._resource_types_refresh_task
+        return await service.get_resource_types([COMPUTE, WEB])
+
+    result = asyncio.run(_run())
+
+    assert _values(result) == ["Microsoft.Compute/compute", "Microsoft.Web/web"]
+    assert store.saved == [result]
+    assert ResourceManagerService._provider_types_failures == {}
+
+
+# ------------------------------------------------------------------
+# stale-while-revalidate
+# ------------------------------------------------------------------
+
+
+def test_expired_cache_is_served_while_one_refresh_runs(
+    service: ResourceManagerService, providers: FakeProviders, clock: FakeClock,
+):
+    async def _run():
+        first = await service.get_resource_types([COMPUTE])
+        clock.now += _RESOURCE_TYPES_CACHE_TTL + 1
+        stale = await asyncio.gather(
+            *(service.get_resource_types([COMPUTE]) for _ in range(5))
+        )
+        await ResourceManagerService._resource_types_refresh_task
+        return first, stale
+
+    first, stale = asyncio.run(_run())
+
+    # 만료된 목록을 바로 반환하고, 동시 요청에도 백그라운드 갱신은 한 번만 돈다
+    assert all(r is first for r in stale)
+    assert providers.calls == [COMPUTE, COMPUTE]
+
+
+# ------------------------------------------------------------------
+# TTL 지터와 stale 한도
+# ------------------------------------------------------------------
+
+
+def test_ttl_is_jittered_within_bounds():
+    low = _RESOURCE_TYPES_CACHE_TTL * (1 - _RESOURCE_TYPES_TTL_JITTER)
+    high = _RESOURCE_TYPES_CACHE_TTL * (1 + _RESOURCE_TYPES_TTL_JITTER)
+
+    ttls = {_jittered_ttl() for _ in range(50)}
+
+    assert all(low <= ttl <= high for ttl in ttls)
+    assert len(ttls) > 1
+
+
+def test_fresh_cache_is_not_refetched_within_ttl(
+    service: ResourceManagerService, providers: FakeProviders, clock: FakeClock,
+):
+    async def _run():
+        await service.get_resource_types([COMPUTE])
+        clock.now += _RESOURCE_TYPES_CACHE_TTL - 1
+        return await service.get_resource_types([COMPUTE])
+
+    assert _values(asyncio.run(_run())) == ["Microsoft.Compute/compute"]
+    assert providers.calls == [COMPUTE]
+
+
+def test_namespace_past_stale_limit_is_dropped(
+    service: ResourceManagerService, providers: FakeProviders, clock: FakeClock,
+):
+    async def _run():
+        await service.get_resource_types([COMPUTE, WEB])
+        providers.failing.add(WEB)
+        clock.now += _RESOURCE_TYPES_STALE_LIMIT + 1
+        return await service.get_resource_types([COMPUTE, WEB])
+
+    result = asyncio.run(_run())
+
+    assert _values(result) == ["Microsoft.Compute/compute"]
+    assert WEB not in ResourceManagerService._provider_types_cache
+
+
+def test_partial_refreshes_do_not_extend_stale_limit(
+    service: ResourceManagerService, providers: FakeProviders, clock: FakeClock,
+):
+    async def _run():
+        await service.get_resource_types([WEB])
+        providers.failing.add(WEB)
+        # 재시도 간격마다 갱신이 실패해 만료 시각만 계속 늦춰진다
+        while clock.now < 1_000_000.0 + _RESOURCE_TYPES_STALE_LIMIT + 1:
+            clock.now += _RESOURCE_TYPES_CACHE_TTL
+            await service.get_resource_types([WEB])
+            task = ResourceManagerService._resource_types_refresh_task
+            if task is not None:
+                await task
+        return await service.get_resource_types([WEB])
+
+    assert asyncio.run(_run()) == []
@@ -0,0 +1,121 @@
+"""RoleService 역할 캐시 테스트."""
+import asyncio
+from typing import Any
+
+from app.services.role import RoleService
+
+
+class FakeStorage:
+    """사용자 조회 호출 수와 MERGE 요청을 기록하는 가짜 StorageService."""
+
+    def __init__(self) -> None:
+        self.users: dict[str, dict[str, Any]] = {}
+        self.reads = 0
+        self.delay = 0.0
+        self.merges: list[tuple[str, dict[str, Any], str | None]] = []
+
+    async def get_portal_user_with_etag(
+        self, email: str,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        self.reads += 1
+        user = self.users.get(email)
+        await asyncio.sleep(self.delay)
+        return (dict(user), f"etag-{self.reads}") if user else (None, None)
+
+    async def merge_portal_user(
+        self, email: str, partial: dict[str, Any], etag: str | None = None,
+    ) -> bool:
+        self.merges.append((email, partial, etag))
+        return True
+
+
+def _service(fake: FakeStorage) -> RoleService:
+    service = RoleService()
+    service._storage = fake
+    return service
+
+
+def _active(role: str) -> dict[str, Any]:
+    return {"role": role, "user_id": "oid", "name": "User", "status": "active"}
+
+
+def test_concurrent_lookups_share_one_read():
+    fake = FakeStorage()
+    fake.users["a@example.com"] = _active("admin")
+    fake.delay = 0.01
+    service = _service(fake)
+
+    async def _run():
+        return await asyncio.gather(
+            *(service.get_or_assign_role({"email": "A@example.com"}) for _ in range(20))
+        )
+
+    assert set(asyncio.run(_run())) == {"admin"}
+    assert fake.reads == 1
+
+
+def test_unknown_user_is_negatively_cached():
+    fake = FakeStorage()
+    service = _service(fake)
+
+    async def _run():
+        first = await service.get_or_assign_role({"email": "nobody@example.com"})
+        second = await service.get_or_assign_role({"email": "nobody@example.com"})
+        return first, second
+
+    assert asyncio.run(_run()) == (None, None)
+    assert fake.reads == 1
+
+
+def test_invalidate_user_forces_fresh_read():
+    fake = FakeStorage()
+    fake.users["a@example.com"] = _active("user")
+    service = _service(fake)
+
+    async def _run():
+        before = await service.get_or_assign_role({"email": "a@example.com"})
+        fake.users["a@example.com"] = _active("admin")
+        cached = await service.get_or_assign_role({"email": "a@example.com"})
+        service.invalidate_user(" A@example.com ")
+        after = await service.get_or_assign_role({"email": "a@example.com"})
+        return before, cached, after
+
+    assert asyncio.run(_run()) == ("user", "user", "admin")
+    assert fake.reads == 2
+
+
+def test_invalidate_during_lookup_does_not_cache_stale_role():
+    fake = FakeStorage()
+    fake.users["a@example.com"] = _active("user")
+    fake.delay = 0.01
+    service = _service(fake)
+
+    async def _run():
+        pending = asyncio.ensure_future(
+            service.get_or_assign_role({"email": "a@example.com"})
+        )
+        while fake.reads == 0:
+            await asyncio.sleep(0)
+        fake.users["a@example.com"] = _active("admin")
+        service.invalidate_user("a@example.com")
+        stale = await pending
+        fresh = await service.get_or_assign_role({"email": "a@example.com"})
+        return stale, fresh
+
+    assert asyncio.run(_run()) == ("user", "admin")
+    assert fake.reads == 2
+
+
+def test_profile_merge_uses_etag_from_lookup():
+    fake = FakeStorage()
+    fake.users["a@example.com"] = {**_active("user"), "user_id": "", "status": "invited"}
+    service = _service(fake)
+
+    role = asyncio.run(
+        service.get_or_assign_role({"email": "a@example.com", "user_id": "oid-1"})
+    )
+
+    assert role == "user"
+    assert fake.merges == [
+        ("a@example.com", {"user_id": "oid-1", "status": "active"}, "etag-1"),
+    ]
@@ -0,0 +1,339 @@
+"""StorageService 테스트."""
+import asyncio
+
+import orjson
+import pytest
+from azure.data.tables import UpdateMode
+
+from app.exceptions import EntityNotFoundError, InvalidFormatError
+from app.models import DeletionFailureItem
+from app.services.storage import (
+    _INVERTED_KEY_RE,
+    DELETION_FAILURES_TABLE,
+    TEMPLATE_PARTITION_KEY,
+    TEMPLATES_TABLE,
+    USERS_TABLE,
+    WORKSHOPS_TABLE,
+    StorageService,
+    _odata_str,
+    _validate_key,
+    _workshop_to_entity,
+    new_deletion_failure_id,
+)
+
+
+def _failure(failure_id: str, failed_at: str) -> DeletionFailureItem:
+    return DeletionFailureItem(
+        id=failure_id,
+        workshop_id="ws-1",
+        resource_type="user",
+        resource_name="user@example.com",
+        failed_at=failed_at,
+    )
+
+
+# ------------------------------------------------------------------
+# _coalesced
+# ------------------------------------------------------------------
+
+
+def test_coalesced_shares_one_fetch_for_concurrent_callers(storage: StorageService):
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"n": calls}]
+
+    async def _run():
+        return await asyncio.gather(
+            *(storage._coalesced("key", fetch) for _ in range(10))
+        )
+
+    results = asyncio.run(_run())
+
+    assert calls == 1
+    assert all(r == [{"n": 1}] for r in results)
+    assert storage._inflight == {}
+
+
+def test_coalesced_does_not_share_across_keys(storage: StorageService):
+    calls: list[str] = []
+
+    def fetch_for(key: str):
+        async def fetch():
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        return fetch
+
+    async def _run():
+        return await asyncio.gather(
+            storage._coalesced("a", fetch_for("a")),
+            storage._coalesced("b", fetch_for("b")),
+        )
+
+    assert asyncio.run(_run()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_coalesced_survives_caller_cancellation(storage: StorageService):
+    release = None
+
+    async def fetch():
+        await release.wait()
+        return "done"
+
+    async def _run():
+        nonlocal release
+        release = asyncio.Event()
+        first = asyncio.ensure_future(storage._coalesced("key", fetch))
+        second = asyncio.ensure_future(storage._coalesced("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        return await second
+
+    assert asyncio.run(_run()) == "done"
+
+
+# ------------------------------------------------------------------
+# _ensure_tables_exist / _requires_tables
+# ------------------------------------------------------------------
+
+
+def test_requires_tables_initializes_once(
+    storage: StorageService, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(StorageService, "_tables_initialized", False)
+
+    async def _run():
+        await asyncio.gather(
+            *(storage.list_deletion_failures_by_workshop("ws-1") for _ in range(5))
+        )
+
+    asyncio.run(_run())
+
+    created = storage.table_service_client.created
+    assert sorted(created) == sorted(set(created))
+    assert DELETION_FAILURES_TABLE in created
+    assert StorageService._tables_initialized
+
+
+def test_requires_tables_skips_init_when_initialized(storage: StorageService):
+    asyncio.run(storage.list_deletion_failures_by_workshop("ws-1"))
+
+    assert storage.table_service_client.created == []
+
+
+# ------------------------------------------------------------------
+# new_deletion_failure_id
+# ------------------------------------------------------------------
+
+
+def test_failure_id_sorts_newest_first():
+    older = new_deletion_failure_id("2025-01-01T00:00:00+00:00")
+    newer = new_deletion_failure_id("2025-01-01T00:00:00.001+00:00")
+
+    assert newer < older
+    assert _INVERTED_KEY_RE.match(older)
+    assert _INVERTED_KEY_RE.match(newer)
+
+
+def test_failure_id_treats_naive_timestamp_as_utc():
+    naive = new_deletion_failure_id("2025-06-01T12:00:00")
+    aware = new_deletion_failure_id("2025-06-01T12:00:00+00:00")
+
+    assert naive.split("_")[0] == aware.split("_")[0]
+
+
+def test_failure_id_is_unique_for_same_timestamp():
+    failed_at = "2025-06-01T12:00:00+00:00"
+
+    assert new_deletion_failure_id(failed_at) != new_deletion_failure_id(failed_at)
+
+
+def test_failure_id_falls_back_for_unparsable_timestamp():
+    assert _INVERTED_KEY_RE.match(new_deletion_failure_id("not-a-date"))
+
+
+# ------------------------------------------------------------------
+# list_deletion_failures_by_workshop / save_deletion_failures
+# ------------------------------------------------------------------
+
+
+def test_list_failures_keeps_server_order_for_inverted_keys(storage: StorageService):
+    failures = [
+        _failure(new_deletion_failure_id(ts), ts)
+        for ts in ("2025-01-03T00:00:00+00:00", "2025-01-01T00:00:00+00:00")
+    ]
+    asyncio.run(storage.save_deletion_failures(failures))
+    table = storage._table(DELETION_FAILURES_TABLE)
+    # 서버는 RowKey 오름차순으로 반환한다
+    table.entities.sort(key=lambda e: e["RowKey"])
+
+    result = asyncio.run(storage.list_deletion_failures_by_workshop("ws-1"))
+
+    assert [f["failed_at"] for f in result] == [
+        "2025-01-03T00:00:00+00:00",
+        "2025-01-01T00:00:00+00:00",
+    ]
+
+
+def test_list_failures_sorts_when_legacy_uuid_keys_present(storage: StorageService):
+    failures = [
+        _failure("0a7c2f9e-legacy", "2025-01-01T00:00:00+00:00"),
+        _failure(
+            new_deletion_failure_id("2025-01-02T00:00:00+00:00"),
+            "2025-01-02T00:00:00+00:00",
+        ),
+        _failure("ffd1e0aa-legacy", "2025-01-03T00:00:00+00:00"),
+    ]
+    asyncio.run(storage.save_deletion_failures(failures))
+    table = storage._table(DELETION_FAILURES_TABLE)
+    table.entities.sort(key=lambda e: e["RowKey"])
+
+    result = asyncio.run(storage.list_deletion_failures_by_workshop("ws-1"))
+
+    assert [f["failed_at"] for f in result] == [
+        "2025-01-03T00:00:00+00:00",
+        "2025-01-02T00:00:00+00:00",
+        "2025-01-01T00:00:00+00:00",
+    ]
+
+
+def test_save_failures_batches_per_100_operations(storage: StorageService):
+    ts = "2025-01-01T00:00:00+00:00"
+    failures = [_failure(new_deletion_failure_id(ts), ts) for _ in range(150)]
+
+    asyncio.run(storage.save_deletion_failures(failures))
+
+    table = storage._table(DELETION_FAILURES_TABLE)
+    assert sorted(len(t) for t in table.transactions) == [50, 100]
+
+
+# ------------------------------------------------------------------
+# 워크샵 요약 조회 ($select)
+# ------------------------------------------------------------------
+
+
+def test_summary_projection_reads_legacy_uncompressed_participants(
+    storage: StorageService,
+):
+    participants = [{"alias": "user01"}, {"alias": "user02"}]
+    table = storage._table(WORKSHOPS_TABLE)
+    # 압축 컬럼 도입 이전에 저장되어 다시 쓰이지 않은 행
+    table.entities.append({
+        "PartitionKey": "workshop",
+        "RowKey": "ws-legacy",
+        "name": "Legacy",
+        "participants_json": orjson.dumps(participants).decode(),
+        "planned_participants_json": orjson.dumps(participants[:1]).decode(),
+    })
+    table.entities.append(
+        _workshop_to_entity("ws-current", {"name": "Current", "participants": participants})
+    )
+
+    result = asyncio.run(
+        storage.list_all_workshops(use_cache=False, include_snapshots=False)
+    )
+
+    by_id = {ws["id"]: ws for ws in result}
+    assert by_id["ws-legacy"]["participants"] == participants
+    assert by_id["ws-legacy"]["planned_participants"] == participants[:1]
+    assert by_id["ws-current"]["participants"] == participants
+    assert by_id["ws-current"]["planned_participants"] == []
+
+# ------------------------------------------------------------------
+# 키 검증
+# ------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("value", ["ws-1", "워크샵-2025", "a" * 1024])
+def test_validate_key_accepts_usable_keys(value: str):
+    _validate_key(value, "workshop_id")
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "../ws", "ws\\1", "ws#1", "ws?1", "ws\n1", "ws\x7f", "a" * 1025, "가" * 342],
+)
+def test_validate_key_rejects_unusable_keys(value: str):
+    with pytest.raises(InvalidFormatError):
+        _validate_key(value, "workshop_id")
+
+
+def test_save_workshop_rejects_invalid_id_before_writing(storage: StorageService):
+    with pytest.raises(InvalidFormatError):
+        asyncio.run(storage.save_workshop_metadata("../ws", {"name": "x"}))
+
+    assert storage._table(WORKSHOPS_TABLE).entities == []
+
+
+def test_odata_str_escapes_single_quotes():
+    assert _odata_str("ws' or RowKey ne '") == "'ws'' or RowKey ne '''"
+
+# ------------------------------------------------------------------
+# update_template
+# ------------------------------------------------------------------
+
+
+def _stored_template(storage: StorageService) -> dict:
+    table = storage._table(TEMPLATES_TABLE)
+    table.entities.append({
+        "PartitionKey": TEMPLATE_PARTITION_KEY,
+        "RowKey": "vnet",
+        "description": "old",
+        "path": "vnet",
+        "template_type": "bicep",
+        "template_content": "resource vnet ...",
+    })
+    return table.entities[-1]
+
+
+def test_update_template_merges_only_changed_fields(storage: StorageService):
+    stored = _stored_template(storage)
+
+    result = asyncio.run(storage.update_template("vnet", description="new"))
+
+    table = storage._table(TEMPLATES_TABLE)
+    assert table.updates == [(
+        UpdateMode.MERGE,
+        {"PartitionKey": TEMPLATE_PARTITION_KEY, "RowKey": "vnet", "description": "new"},
+    )]
+    assert stored["template_content"] == "resource vnet ..."
+    assert result == {
+        "name": "vnet", "description": "new", "path": "vnet", "template_type": "bicep",
+    }
+
+
+def test_update_template_raises_not_found_for_missing_template(storage: StorageService):
+    with pytest.raises(EntityNotFoundError):
+        asyncio.run(storage.update_template("missing", description="new"))
+
+
+# ------------------------------------------------------------------
+# 포털 사용자 조회
+# ------------------------------------------------------------------
+
+
+def test_portal_user_etag_is_returned_separately(storage: StorageService):
+    storage._table(USERS_TABLE).entities.append({
+        "PartitionKey": "user",
+        "RowKey": "a@example.com",
+        "user_id": "oid",
+        "name": "User",
+        "role": "admin",
+        "status": "active",
+        "registered_at": "2025-01-01T00:00:00+00:00",
+    })
+
+    user = asyncio.run(storage.get_portal_user(" A@example.com "))
+    user_with_etag, etag = asyncio.run(storage.get_portal_user_with_etag("a@example.com"))
+
+    assert "etag" not in user
+    assert user_with_etag == user
+    assert etag
+    assert asyncio.run(storage.get_portal_user_with_etag("b@example.com")) == (None, None)
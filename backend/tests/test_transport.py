@@ -0,0 +1,41 @@
+"""Azure SDK 재시도 정책 테스트."""
+from types import SimpleNamespace
+
+from app.services.transport import JitteredAsyncRetryPolicy
+
+
+def _response(headers: dict[str, str]) -> SimpleNamespace:
+    return SimpleNamespace(http_response=SimpleNamespace(headers=headers))
+
+
+def _policy() -> JitteredAsyncRetryPolicy:
+    return JitteredAsyncRetryPolicy(
+        retry_total=3, retry_backoff_factor=1.0, retry_backoff_max=30,
+    )
+
+
+def test_backoff_is_jittered_below_exponential_value():
+    policy = _policy()
+    settings = policy.configure_retries({})
+    settings["history"] = [object()] * 3  # 세 번째 연속 실패 -> 최대 4초
+
+    backoffs = {policy.get_backoff_time(settings) for _ in range(50)}
+
+    assert all(2 <= b <= 4 for b in backoffs)
+    assert len(backoffs) > 1
+
+
+def test_first_retry_has_no_backoff():
+    policy = _policy()
+    settings = policy.configure_retries({})
+    settings["history"] = [object()]
+
+    assert policy.get_backoff_time(settings) == 0
+
+
+def test_retry_after_is_clamped_to_backoff_max():
+    policy = _policy()
+
+    assert policy.get_retry_after(_response({"Retry-After": "300"})) == 30
+    assert policy.get_retry_after(_response({"Retry-After": "5"})) == 5
+    assert policy.get_retry_after(_response({})) is None